@@ -1,39 +1,162 @@
 #!/usr/bin/env python3
 import sys
+import os
+from itertools import product
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import as_buffer, int_list, load_default
+from aoc25.log import answer, answer_table, get_logger
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = get_logger("day01")
 
 STARTING_VALUE = 50
 MODULO_VALUE = 100
 
-# Use example.txt as default if no stdin provided
-if sys.stdin.isatty():
-    input_file = open('example.txt', 'r')
-else:
-    input_file = sys.stdin
-
-dial = STARTING_VALUE
-result = 0
-
-for line in input_file:
-    line = line.strip()
-    if not line:
-        continue
-
-    if line.startswith('L'):
-        value = int(line[1:])
-        # Count how many full rotations (wraps around 0)
-        result += value // MODULO_VALUE
-        # Reduce value to single rotation
-        value = value % MODULO_VALUE
-        # Check if this operation crosses 0
-        if dial != 0 and value >= dial:
-            result += 1
-        dial = (dial - value) % MODULO_VALUE
-
-    elif line.startswith('R'):
-        value = int(line[1:])
-        # Count how many times we pass 0 going right
-        result += (dial + value) // MODULO_VALUE
-        dial = (dial + value) % MODULO_VALUE
-
-print(f"Final dial value: {dial}")
-print(f"Final result: {result}")
+# L becomes a minus sign and R a separator, so one bulk scan gives signed steps
+ROTATION_SIGNS = bytes.maketrans(b'LR', b'- ')
+
+# Upper bound on rotations x configurations evaluated at once by rotate_many
+CHUNK_ELEMENTS = 1 << 20
+
+def parse(data) -> list[int]:
+    """Parse rotations into signed steps: L is negative, R is positive."""
+    return int_list(bytes(as_buffer(data)).translate(ROTATION_SIGNS), signed=True)
+
+def rotate(rotations: list[int], start: int = STARTING_VALUE, modulo: int = MODULO_VALUE) -> tuple[int, int, int]:
+    """Turn the dial through all rotations.
+
+    Returns (final dial, rotations ending on 0, times the dial passed 0).
+    """
+    dial = start
+    stops = 0
+    result = 0
+
+    for rotation in rotations:
+        if rotation < 0:
+            value = -rotation
+            # Count how many full rotations (wraps around 0)
+            result += value // modulo
+            # Reduce value to single rotation
+            value = value % modulo
+            # Check if this operation crosses 0
+            if dial != 0 and value >= dial:
+                result += 1
+            dial = (dial - value) % modulo
+        else:
+            # Count how many times we pass 0 going right
+            result += (dial + rotation) // modulo
+            dial = (dial + rotation) % modulo
+
+        if dial == 0:
+            stops += 1
+
+    return dial, stops, result
+
+def rotate_many(rotations: list[int], starts, moduli, chunk_elements: int = CHUNK_ELEMENTS):
+    """rotate() for many (start, modulo) configurations in one pass.
+
+    The dial after k rotations is (start + sum of the first k steps) mod
+    modulo, so every rotation can be evaluated independently once its
+    starting dial is known. Rotations are taken in chunks laid out as
+    rotations x configurations, bounding memory at about `chunk_elements`
+    values per array. Returns (final dials, stops, crossings) arrays with
+    one entry per configuration.
+    """
+    if np is None:
+        raise RuntimeError("rotate_many needs numpy installed")
+
+    starts = np.asarray(starts, dtype=np.int64)
+    moduli = np.asarray(moduli, dtype=np.int64)
+    if starts.shape != moduli.shape:
+        raise ValueError("Need one modulo per start position")
+    if np.any(moduli <= 0) or np.any(starts < 0) or np.any(starts >= moduli):
+        raise ValueError("Every configuration needs 0 <= start < modulo")
+
+    steps = np.asarray(rotations, dtype=np.int64)
+    dials = starts.copy()
+    stops = np.zeros_like(starts)
+    crossings = np.zeros_like(starts)
+    chunk = max(1, chunk_elements // max(1, starts.size))
+
+    for begin in range(0, steps.size, chunk):
+        deltas = steps[begin:begin + chunk, None]
+        # Dial before each rotation of the chunk, per configuration
+        offsets = np.cumsum(deltas, axis=0) - deltas
+        before = (dials + offsets) % moduli
+        after = (before + deltas) % moduli
+
+        # Right turns pass 0 once per wrap
+        right = (before + deltas) // moduli
+        # Left turns: full turns, plus one if the remainder reaches 0 from a non-zero dial
+        value = -deltas
+        left = value // moduli + ((before != 0) & (value % moduli >= before))
+        crossings += np.where(deltas < 0, left, right).sum(axis=0)
+
+        stops += (after == 0).sum(axis=0)
+        dials = after[-1]
+
+    return dials, stops, crossings
+
+def part1(rotations: list[int]) -> int:
+    """Count rotations that leave the dial on 0."""
+    return rotate(rotations)[1]
+
+def part2(rotations: list[int]) -> int:
+    """Count every time the dial points at 0, including mid-rotation."""
+    return rotate(rotations)[2]
+
+def solve(text: str) -> tuple[int, int]:
+    rotations = parse(text)
+    return part1(rotations), part2(rotations)
+
+def add_arguments(parser):
+    parser.add_argument('--starts', type=int, nargs='+', metavar='N',
+                        help="sweep these start positions (default: the puzzle's)")
+    parser.add_argument('--moduli', type=int, nargs='+', metavar='N',
+                        help="sweep these dial sizes (default: the puzzle's)")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided
+    data = load_default(script_dir)
+
+    with phase("parse"):
+        rotations = parse(data)
+
+    if args.starts is None and args.moduli is None:
+        with phase("rotate"):
+            dial, stops, crossings = rotate(rotations)
+
+        log.info("Final dial value: %d", dial)
+        answer(1, stops)
+        answer(2, crossings)
+        return
+
+    # Sweep every (start, modulo) pair from the two lists in one pass
+    pairs = list(product(args.starts or [STARTING_VALUE], args.moduli or [MODULO_VALUE]))
+    configs = [(start, modulo) for start, modulo in pairs if 0 <= start < modulo]
+    if len(configs) < len(pairs):
+        log.warning("Skipping %d configurations whose start is not in [0, modulo)", len(pairs) - len(configs))
+    if not configs:
+        log.error("No configuration with 0 <= start < modulo")
+        return
+    starts, moduli = zip(*configs)
+    with phase("rotate many"):
+        dials, stops, crossings = rotate_many(rotations, starts, moduli)
+
+    answer_table('configs', ['start', 'modulo', 'dial', 'stops', 'crossings'],
+                 zip(starts, moduli, dials.tolist(), stops.tolist(), crossings.tolist()))
+
+
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
@@ -1,7 +1,22 @@
 #!/usr/bin/env python3
 import sys
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import assert_type
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import CHUNK_SIZE, int_tuples, iter_ints, open_default
+from aoc25.log import Progress, answer, get_logger
+
+log = get_logger("day02")
+
+BATCH_IDS = 50_000  # IDs handed to a worker at a time
+
 def isRepeating(s: str, n: str) -> bool:
     assert_type(s, str)
     assert_type(n, str)
@@ -34,24 +49,113 @@ def find_duplicates(n: int) -> int:
         return 0
 
 
-if sys.stdin.isatty():
-    input_file = open('example.txt', 'r')
-else:
-    input_file = sys.stdin
+def parse(data) -> list[tuple[int, int]]:
+    """Parse the comma-separated list of inclusive ranges."""
+    return int_tuples(data, 2)
+
+def iter_ranges(stream, chunk_size: int = CHUNK_SIZE):
+    """Yield (start, end) pairs from the range feed as it is read.
+
+    The feed is tokenized chunk by chunk, so only the current chunk is held
+    however long the single input line is.
+    """
+    numbers = iter_ints(stream, chunk_size)
+    for start in numbers:
+        end = next(numbers, None)
+        if end is None:
+            raise ValueError(f"Range starting at {start} has no end")
+        yield start, end
+
+def iter_batches(pairs, batch_ids: int):
+    """Group ranges into batches of about `batch_ids` IDs, splitting long ranges.
+
+    Both parts sum over single IDs, so a range can be cut anywhere.
+    """
+    batch = []
+    size = 0
+    for start, end in pairs:
+        while start <= end:
+            stop = min(end, start + batch_ids - size - 1)
+            batch.append((start, stop))
+            size += stop - start + 1
+            start = stop + 1
+            if size >= batch_ids:
+                yield batch
+                batch = []
+                size = 0
+    if batch:
+        yield batch
+
+def sum_streamed(pairs, count, workers: int | None = None, batch_ids: int = BATCH_IDS) -> int:
+    """Sum count(batch) over batches of pairs while they are still being parsed.
+
+    With workers=0 the batches are counted in this process. Otherwise they
+    go to a process pool, with at most two batches per worker in flight, so
+    parsing runs ahead of the workers without piling up the whole input.
+    """
+    batches = iter_batches(pairs, batch_ids)
+    progress = Progress(log, "Summed %d batches of ranges...")
+    if workers == 0:
+        total = 0
+        for done, batch in enumerate(batches, 1):
+            total += count(batch)
+            progress.update(done)
+        return total
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        max_in_flight = 2 * workers
+        pending = deque()
+        total = 0
+        done = 0
+        for batch in batches:
+            pending.append(executor.submit(count, batch))
+            if len(pending) >= max_in_flight:
+                total += pending.popleft().result()
+                done += 1
+                progress.update(done)
+        while pending:
+            total += pending.popleft().result()
+    return total
+
+def part1(ranges: list[tuple[int, int]]) -> int:
+    """Sum IDs made of one sequence repeated exactly twice."""
+    res = 0
+    for start, end in ranges:
+        for i in range(start, end + 1):
+            if len(str(i)) % 2 != 0:
+                continue
+            res += find_duplicates(i)
+    return res
+
+def part2(ranges: list[tuple[int, int]]) -> int:
+    """Sum IDs made of one sequence repeated at least twice."""
+    res = 0
+    for start, end in ranges:
+        for i in range(start, end + 1):
+            res += find_occurences(i)
+    return res
+
+def solve(text: str) -> tuple[int, int]:
+    ranges = parse(text)
+    return part1(ranges), part2(ranges)
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help="worker processes (default: one per CPU, 0 to stay in this process)")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided; the feed is streamed, never read whole
+    stream = open_default(script_dir)
 
-line = input_file.read().strip()
-ranges = []
+    with phase("part 2"):
+        res = sum_streamed(iter_ranges(stream), part2, args.workers)
 
-for range_str in line.split(','):
-    start, end = range_str.split('-')
-    ranges.append((int(start), int(end)))
+    answer(2, res)
 
-res = 0
-for start, end in ranges:
-    for i in range(start, end + 1):
-        # if len(str(i)) % 2 != 0:
-        #     continue
-        # res += find_duplicates(i)
-        res += find_occurences(i)
 
-print(f"Final result: {res}")
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
 import sys
+import os
 from typing import assert_type
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.log import answer, get_logger
+
+log = get_logger("day03")
+
 def find_highest_n_digits(line: str, remaining_digits: int, start: int = 0) -> str:
     """
     Naive recursive solution: Find the highest remaining_digits-digit number from line[start:] while keeping order.
@@ -92,18 +102,32 @@ def part2optimal(lines: list[str]) -> int:
             res += int(highest_12_digit)
     return res
 
-if sys.stdin.isatty():
-    input_file = open('example.txt', 'r')
-else:
-    input_file = sys.stdin
+def parse(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines()]
+
+def solve(text: str) -> tuple[int, int]:
+    lines = parse(text)
+    return part1(lines), part2optimal(lines)
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    if sys.stdin.isatty():
+        input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
+    else:
+        input_file = sys.stdin
+
+    with phase("parse"):
+        lines = parse(input_file.read())
 
-lines = [line.strip() for line in input_file]
-res = 0
+    # res1 = part1(lines)
+    with phase("part 2"):
+        res2 = part2(lines)
+    # res3 = part2optimal(lines)
+    # print(f"Final result part 1: {res1}")
+    answer(2, res2)
+    # print(f"Final result part 2 optimal: {res3}")
 
 
-# res1 = part1(lines)
-res2 = part2(lines)
-# res3 = part2optimal(lines)
-# print(f"Final result part 1: {res1}")
-print(f"Final result part 2: {res2}")
-# print(f"Final result part 2 optimal: {res3}")
+if __name__ == "__main__":
+    run_script(main)
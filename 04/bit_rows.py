@@ -0,0 +1,77 @@
+"""Pure-Python bit-sliced neighbour counting, one big int per grid row.
+
+Bit c of a row mask is set when column c holds a roll. The 8 neighbour
+masks of a row are its own row and the rows above and below shifted by a
+column either way; adding them with carry-save adders gives the neighbour
+count of every cell at once, as 4 bit-planes.
+"""
+
+_ROLL_BITS = str.maketrans('.@', '01')
+
+
+def line_masks(lines: list[str]) -> list[int]:
+    """Row masks straight from the grid text, one int() per line."""
+    # Column 0 is the lowest bit, so each line is read reversed
+    return [int(line[::-1].translate(_ROLL_BITS), 2) if line else 0 for line in lines]
+
+
+def full_adder(a: int, b: int, c: int) -> tuple[int, int]:
+    """Bitwise a + b + c as (sum, carry)."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def neighbour_planes(above: int, row: int, below: int, full: int) -> tuple[int, int, int, int]:
+    """Per-bit neighbour count of `row` as bit-planes (ones, twos, fours, eights)."""
+    left_above, right_above = (above << 1) & full, above >> 1
+    left_below, right_below = (below << 1) & full, below >> 1
+    left, right = (row << 1) & full, row >> 1
+
+    # Eight weight-1 inputs: two full adders and a half adder, then fold the sums
+    sum1, carry1 = full_adder(left_above, above, right_above)
+    sum2, carry2 = full_adder(left_below, below, right_below)
+    sum3, carry3 = left ^ right, left & right
+    ones, carry4 = full_adder(sum1, sum2, sum3)
+
+    # Four weight-2 carries, then the two weight-4 carries they produce
+    sum5, carry5 = full_adder(carry1, carry2, carry3)
+    twos, carry6 = sum5 ^ carry4, sum5 & carry4
+    return ones, twos, carry5 ^ carry6, carry5 & carry6
+
+
+def accessible_masks(masks: list[int], cols: int) -> list[int]:
+    """Per row, the rolls with at most 3 neighbouring rolls.
+
+    A count of 3 or less is exactly a count with neither the fours nor the
+    eights plane set.
+    """
+    full = (1 << cols) - 1
+    result = []
+    above = 0
+    for r, row in enumerate(masks):
+        below = masks[r + 1] if r + 1 < len(masks) else 0
+        _, _, fours, eights = neighbour_planes(above, row, below, full)
+        result.append(row & ~(fours | eights))
+        above = row
+    return result
+
+
+def count_accessible(masks: list[int], cols: int) -> int:
+    return sum(mask.bit_count() for mask in accessible_masks(masks, cols))
+
+
+def peel(masks: list[int], cols: int) -> int:
+    """Remove accessible rolls round by round until none are left.
+
+    Each round removes every accessible roll at once; removals only lower
+    counts, so this ends with the same rolls removed as one at a time.
+    """
+    masks = list(masks)
+    removed = 0
+    while True:
+        accessible = accessible_masks(masks, cols)
+        count = sum(mask.bit_count() for mask in accessible)
+        if not count:
+            return removed
+        removed += count
+        masks = [row & ~gone for row, gone in zip(masks, accessible)]
@@ -1,62 +1,86 @@
 #!/usr/bin/env python3
 import sys
+import os
 
-def nearest8(grid: list[list[str]], coordinates: tuple[int, int]) -> bool:
-    deltas = [(-1, -1), (-1, 0), (-1, 1),
-              (0, -1),          (0, 1),
-              (1, -1),  (1, 0), (1, 1)]
-    # neighbors = []
-    r, c = coordinates
-    rolls = 0
-    for dr, dc in deltas:
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < rows and 0 <= nc < cols:
-            if grid[nr][nc] == '@':
-                rolls += 1
-    return rolls <= 3 
-
-def part1(grid: list[list[str]]) -> int:
-    res = 0
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == '.':
-                continue
-            if nearest8(grid, (r, c)):
-                # print(f"Cell ({r}, {c}) is accessible")
-                res += 1
-    return res
-
-def part2(grid: list[list[str]]):
-    one_accessible = True
-    res = 0
-    while one_accessible:
-        one_accessible = False
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] == '.':
-                    continue
-                if nearest8(grid, (r, c)):
-                    one_accessible = True
-                    res += 1
-                    grid[r][c] = '.'
-    return res
-
-
-
-if sys.stdin.isatty():
-    input_file = open('example.txt', 'r')
-else:
-    input_file = sys.stdin
-
-# Read as a 2D grid for easy traversal
-grid = [list(line.strip()) for line in input_file]
-# Grid dimensions
-rows = len(grid)
-cols = len(grid[0]) if rows > 0 else 0
-
-print(f"Grid size: {rows}x{cols}")
-res1 = part1(grid)
-print(f"Final result part 1: {res1}")
-res2 = part2(grid)
-print(f"Final result part 2: {res2}")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
 
+from aoc25.instrument import phase, run_script
+from aoc25.log import answer, get_logger
+from roll_grid import RollGrid
+import bit_rows
+
+log = get_logger("day04")
+
+def part1(grid: RollGrid) -> int:
+    """Rolls with at most three neighbouring rolls; kept live by the grid."""
+    return grid.accessible
+
+def part2(grid: RollGrid) -> int:
+    """Keep removing accessible rolls until none are left.
+
+    Peels a snapshot, so the live grid (and part1) are left as they were.
+    """
+    return grid.snapshot().peel()
+
+def part1_bits(rows: tuple[list[int], int]) -> int:
+    """part1 on one big int per row: O(rows) bitwise operations."""
+    masks, cols = rows
+    return bit_rows.count_accessible(masks, cols)
+
+def part2_bits(rows: tuple[list[int], int]) -> int:
+    """part2 on row bitmasks, peeling every accessible roll per round."""
+    masks, cols = rows
+    return bit_rows.peel(masks, cols)
+
+def parse(text: str) -> RollGrid:
+    return RollGrid.from_lines([line.strip() for line in text.splitlines()])
+
+def parse_bits(text: str) -> tuple[list[int], int]:
+    """Row masks and grid width for the bits engine, without building a RollGrid."""
+    lines = [line.strip() for line in text.splitlines()]
+    return bit_rows.line_masks(lines), max((len(line) for line in lines), default=0)
+
+def solve(text: str) -> tuple[int, int]:
+    grid = parse(text)
+    return part1(grid), part2(grid)
+
+def add_arguments(parser):
+    parser.add_argument('--engine', choices=('grid', 'bits'), default='grid',
+                        help="live neighbour-count grid, or bit-sliced row masks")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    if sys.stdin.isatty():
+        input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
+    else:
+        input_file = sys.stdin
+
+    if args.engine == 'bits':
+        with phase("parse"):
+            rows = parse_bits(input_file.read())
+        log.info("Grid size: %dx%d", len(rows[0]), rows[1])
+        with phase("part 1"):
+            res1 = part1_bits(rows)
+        answer(1, res1)
+        with phase("part 2"):
+            res2 = part2_bits(rows)
+        answer(2, res2)
+        return
+
+    with phase("parse"):
+        grid = parse(input_file.read())
+
+    log.info("Grid size: %dx%d", grid.rows, grid.cols)
+    with phase("part 1"):
+        res1 = part1(grid)
+    answer(1, res1)
+    with phase("part 2"):
+        res2 = part2(grid)
+    answer(2, res2)
+
+
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
@@ -0,0 +1,124 @@
+"""Roll grid with live neighbour counts and accessible-roll count."""
+
+ACCESS_LIMIT = 3  # A roll is accessible with at most this many neighbouring rolls
+
+
+class RollGrid:
+    """Rolls on a grid, with the accessible count kept up to date.
+
+    Cells live in flat bytearrays with a one-cell empty border, so the 8
+    neighbours of any cell are fixed offsets and need no bounds checks.
+    `counts` holds the number of neighbouring rolls of every cell.
+
+    snapshot() is copy-on-write: the copy shares the arrays until either
+    side changes a cell.
+    """
+    __slots__ = ('rows', 'cols', 'stride', 'rolls', 'counts', 'accessible', 'offsets', '_shared')
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self.stride = cols + 2
+        self.rolls = bytearray((rows + 2) * self.stride)
+        self.counts = bytearray((rows + 2) * self.stride)
+        self.accessible = 0
+        s = self.stride
+        self.offsets = (-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1)
+        self._shared = False
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> 'RollGrid':
+        grid = cls(len(lines), len(lines[0]) if lines else 0)
+        for r, line in enumerate(lines):
+            for c, char in enumerate(line):
+                if char == '@':
+                    grid.add_roll(r, c)
+        return grid
+
+    def _index(self, r: int, c: int) -> int:
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(f"Cell ({r}, {c}) is outside the {self.rows}x{self.cols} grid")
+        return (r + 1) * self.stride + c + 1
+
+    def _own(self):
+        # Copy the shared arrays before the first write after a snapshot
+        if self._shared:
+            self.rolls = bytearray(self.rolls)
+            self.counts = bytearray(self.counts)
+            self._shared = False
+
+    def snapshot(self) -> 'RollGrid':
+        copy = RollGrid.__new__(RollGrid)
+        for name in ('rows', 'cols', 'stride', 'rolls', 'counts', 'accessible', 'offsets'):
+            setattr(copy, name, getattr(self, name))
+        copy._shared = self._shared = True
+        return copy
+
+    def has_roll(self, r: int, c: int) -> bool:
+        return bool(self.rolls[self._index(r, c)])
+
+    def is_accessible(self, r: int, c: int) -> bool:
+        i = self._index(r, c)
+        return bool(self.rolls[i]) and self.counts[i] <= ACCESS_LIMIT
+
+    def add_roll(self, r: int, c: int) -> bool:
+        """Place a roll; returns False if the cell already had one."""
+        i = self._index(r, c)
+        if self.rolls[i]:
+            return False
+        self._own()
+        rolls, counts = self.rolls, self.counts
+        rolls[i] = 1
+        for offset in self.offsets:
+            j = i + offset
+            counts[j] += 1
+            # A neighbour going from 3 to 4 rolls stops being accessible
+            if rolls[j] and counts[j] == ACCESS_LIMIT + 1:
+                self.accessible -= 1
+        if counts[i] <= ACCESS_LIMIT:
+            self.accessible += 1
+        return True
+
+    def remove_roll(self, r: int, c: int) -> bool:
+        """Take a roll away; returns False if the cell was empty."""
+        i = self._index(r, c)
+        if not self.rolls[i]:
+            return False
+        self._own()
+        self._remove(i)
+        return True
+
+    def _remove(self, i: int):
+        rolls, counts = self.rolls, self.counts
+        if counts[i] <= ACCESS_LIMIT:
+            self.accessible -= 1
+        rolls[i] = 0
+        for offset in self.offsets:
+            j = i + offset
+            counts[j] -= 1
+            # A neighbour going from 4 to 3 rolls becomes accessible
+            if rolls[j] and counts[j] == ACCESS_LIMIT:
+                self.accessible += 1
+
+    def peel(self) -> int:
+        """Remove accessible rolls until none are left; returns how many went.
+
+        Removing a roll only lowers neighbour counts, so the rolls that end
+        up removed do not depend on the order. A worklist revisits only the
+        neighbours of removed rolls instead of rescanning the grid.
+        """
+        self._own()
+        rolls, counts = self.rolls, self.counts
+        stack = [i for i in range(len(rolls)) if rolls[i] and counts[i] <= ACCESS_LIMIT]
+        removed = 0
+        while stack:
+            i = stack.pop()
+            if not rolls[i]:
+                continue
+            self._remove(i)
+            removed += 1
+            for offset in self.offsets:
+                j = i + offset
+                if rolls[j] and counts[j] == ACCESS_LIMIT:
+                    stack.append(j)
+        return removed
@@ -1,31 +1,30 @@
 #!/usr/bin/env python3
 import sys
+import os
 
-def parse_input(input_file):
-    """Parse input file into ranges and IDs to check."""
-    ranges = []
-    ids_to_check = []
-    reading_ranges = True
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
 
-    for line in input_file:
-        line = line.strip()
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import as_buffer, int_list, int_tuples, load_default
+from aoc25.log import answer, get_logger
 
-        if not line:
-            reading_ranges = False
-            continue
+log = get_logger("day05")
 
-        if reading_ranges:
-            # Parse range like "3-5"
-            start, end = map(int, line.split('-'))
-            ranges.append((start, end))
-        else:
-            # Parse individual IDs
-            ids_to_check.append(int(line))
+def parse_input(data):
+    """Parse the input buffer into ranges and IDs to check."""
+    buffer = as_buffer(data)
 
-    return ranges, ids_to_check
+    # A blank line separates ranges like "3-5" from the individual IDs
+    split = buffer.find(b'\n\n')
+    if split == -1:
+        return int_tuples(buffer, 2), []
+    return int_tuples(buffer[:split], 2), int_list(buffer[split:])
 
-def part1(ranges, ids_to_check):
+def part1(data):
     """Count how many IDs fall within any of the fresh ranges."""
+    ranges, ids_to_check = data
     fresh_count = 0
     for id_num in ids_to_check:
         is_fresh = False
@@ -38,8 +37,9 @@ def part1(ranges, ids_to_check):
 
     return fresh_count
 
-def part2(ranges):
+def part2(data):
     """Calculate total coverage by merging overlapping ranges."""
+    ranges, _ = data
     if not ranges:
         return 0
 
@@ -64,16 +64,34 @@ def part2(ranges):
 
     return total
 
-# Use example.txt as default if no stdin provided
-if sys.stdin.isatty():
-    input_file = open('example.txt', 'r')
-else:
-    input_file = sys.stdin
+def parse(data):
+    """Parse the input into (ranges sorted by start, IDs to check)."""
+    ranges, ids_to_check = parse_input(data)
+    ranges.sort(
+        key=lambda x: x[0]
+    )
+    return ranges, ids_to_check
+
+def solve(text):
+    data = parse(text)
+    return part1(data), part2(data)
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided
+    data = load_default(script_dir)
+
+    with phase("parse"):
+        data = parse(data)
+
+    with phase("part 1"):
+        res1 = part1(data)
+    answer(1, res1)
+    with phase("part 2"):
+        res2 = part2(data)
+    answer(2, res2)
 
-ranges, ids_to_check = parse_input(input_file)
-ranges.sort(
-    key=lambda x: x[0]
-)
 
-print(f"Part 1: {part1(ranges, ids_to_check)}")
-print(f"Part 2: {part2(ranges)}")
+if __name__ == "__main__":
+    run_script(main)
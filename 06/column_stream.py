@@ -0,0 +1,90 @@
+"""Column-chunked evaluation of wide worksheets, straight from a mapped buffer."""
+
+import re
+
+from math import prod
+
+CHUNK_COLUMNS = 1 << 16  # Columns read from every row per step
+
+_OPERATOR = re.compile(rb'[^ ]')
+
+
+def row_spans(buffer) -> list[tuple[int, int]]:
+    """(start, end) byte offsets of every line, ends excluding the newline."""
+    spans = []
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start)
+        if end == -1:
+            end = len(buffer)
+        spans.append((start, end))
+        start = end + 1
+    return spans
+
+
+def iter_problems(buffer, chunk_columns: int = CHUNK_COLUMNS):
+    """Yield every problem as its list of row slices, operator row last.
+
+    All rows are read in lockstep, `chunk_columns` at a time, through views
+    at each row's offset. A problem starts at its operator and ends at the
+    blank column before the next operator; the last problem of a chunk may
+    go on past it, so it is carried into the next chunk. Memory follows
+    the widest problem rather than the sheet.
+    """
+    spans = row_spans(buffer)
+    if not spans:
+        return
+    width = max(end - start for start, end in spans)
+    carry = [b''] * len(spans)
+
+    for begin in range(0, width, chunk_columns):
+        stop = min(width, begin + chunk_columns)
+        rows = []
+        for (start, end), carried in zip(spans, carry):
+            piece = buffer[min(start + begin, end):min(start + stop, end)]
+            rows.append(carried + piece.ljust(stop - begin))
+
+        starts = [match.start() for match in _OPERATOR.finditer(rows[-1])]
+        for lo, hi in zip(starts, starts[1:]):
+            yield [row[lo:hi - 1] for row in rows]
+
+        carry = [b''] * len(spans)
+        if starts:
+            last = starts[-1]
+            if stop < width:
+                carry = [row[last:] for row in rows]
+            else:
+                yield [row[last:] for row in rows]
+
+
+def apply(operator: bytes, numbers: list[int]) -> int:
+    if operator == b'+':
+        return sum(numbers)
+    if operator == b'*':
+        return prod(numbers)
+    return 0
+
+
+def evaluate(problem: list[bytes]) -> tuple[int, int]:
+    """Both readings of one problem: numbers along the rows, then down the columns."""
+    *number_rows, operator_row = problem
+    operator = operator_row.strip()
+
+    row_numbers = [int(row) for row in number_rows if row.strip()]
+    column_numbers = []
+    for column in zip(*number_rows):
+        digits = bytes(column).replace(b' ', b'')
+        # Columns padded out past the problem's numbers hold no digits
+        if digits:
+            column_numbers.append(int(digits))
+    return apply(operator, row_numbers), apply(operator, column_numbers)
+
+
+def stream_totals(buffer, chunk_columns: int = CHUNK_COLUMNS) -> tuple[int, int]:
+    """Grand totals for both parts, accumulated problem by problem."""
+    total1 = total2 = 0
+    for problem in iter_problems(buffer, chunk_columns):
+        result1, result2 = evaluate(problem)
+        total1 += result1
+        total2 += result2
+    return total1, total2
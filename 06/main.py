@@ -1,6 +1,19 @@
 #!/usr/bin/env python3
 from encodings.punycode import digits
+import logging
 import sys
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import load_default
+from aoc25.log import answer, get_logger
+from column_stream import stream_totals
+
+log = get_logger("day06")
 
 def parse_input1(input_file):
     """Parse input file, keeping lines as strings to preserve spacing."""
@@ -24,6 +37,8 @@ def parse_input1(input_file):
 
 def parse_input2(input_file):
     """Parse input file for part 2, respecting exact column positions."""
+    # Checked once: the per-digit trace below must not cost anything when off
+    debug = log.isEnabledFor(logging.DEBUG)
     lines = []
     for line in input_file:
         # Don't strip - we need to preserve spacing
@@ -66,16 +81,18 @@ def parse_input2(input_file):
                 else:
                     continue
             for i in range(len(digits) - 1, -1, -1):
-                print(f"Digit found: {digits[i]} at position {i}")
+                if debug:
+                    log.debug("Digit found: %s at position %d", digits[i], i)
                 column_numbers.append(int(digits[i]) * (10 ** (len(digits) - 1 - i)))
             numbers.append(sum(column_numbers))
         final_numbers.append(numbers)
-    print(f"Final numbers: {final_numbers}, operators: {operators}")
+    log.debug("Final numbers: %s, operators: %s", final_numbers, operators)
     return final_numbers, operators
 
-def part1(numbers, operators):
+def sum_row_problems(numbers, operators):
     """Parse vertical math problems and calculate grand total."""
     grand_total = 0
+    debug = log.isEnabledFor(logging.DEBUG)
 
     # numbers is a list of rows, we need to transpose to get columns
     # Each column is one problem
@@ -100,18 +117,20 @@ def part1(numbers, operators):
         else:
             result = 0
 
-        print(f"Problem {col_idx + 1}: {' '.join(map(str, column_numbers))} {operator} = {result}")
+        if debug:
+            log.debug("Problem %d: %s %s = %d", col_idx + 1, ' '.join(map(str, column_numbers)), operator, result)
         grand_total += result
 
     return grand_total
 
-def part2(problems):
+def sum_column_problems(problems):
     """Calculate result treating each operator position as a single multi-digit number."""
     if not problems:
         return 0
 
 
     grand_total = 0
+    debug = log.isEnabledFor(logging.DEBUG)
     for column_numbers, operator in problems:
         if operator == '+':
             result = sum(column_numbers)
@@ -122,31 +141,63 @@ def part2(problems):
         else:
             result = 0
 
-        print(f"Problem: {' '.join(map(str, column_numbers))} {operator} = {result}")
+        if debug:
+            log.debug("Problem: %s %s = %d", ' '.join(map(str, column_numbers)), operator, result)
         grand_total += result
 
     return grand_total
 
-# Use example.txt as default if no stdin provided
-import os
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-if sys.stdin.isatty():
-    input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
-else:
-    input_file = sys.stdin
-
-# numbers, operators = parse_input1(input_file)
-# print(f"Part 1: {part1(numbers, operators)}")
-
-# Re-open file for part 2 since we already consumed it
-if sys.stdin.isatty():
-    input_file2 = open(os.path.join(script_dir, 'example.txt'), 'r')
-else:
-    # For stdin, we'd need to store the content or re-read
-    input_file2 = input_file
-
-# numbers, operators = parse_input1(input_file)
-# print(f"Part 1: {part1(numbers, operators)}")
-numbers, operators = parse_input2(input_file2)
-print(f"Part 2: {part2(zip(numbers, operators))}")
+def parse(text):
+    """Split the worksheet into lines, keeping their spacing."""
+    return text.splitlines()
+
+def part1(lines):
+    with phase("read rows"):
+        numbers, operators = parse_input1(lines)
+    with phase("evaluate"):
+        return sum_row_problems(numbers, operators)
+
+def part2(lines):
+    with phase("read columns"):
+        numbers, operators = parse_input2(lines)
+    with phase("evaluate"):
+        return sum_column_problems(zip(numbers, operators))
+
+def solve(text):
+    lines = parse(text)
+    return part1(lines), part2(lines)
+
+def add_arguments(parser):
+    parser.add_argument('--stream', action='store_true',
+                        help="evaluate both parts column chunk by column chunk from a mapped file")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    if args.stream:
+        # Piped input is spooled to a temporary file so the rows can be mapped
+        buffer = load_default(script_dir, spool=True)
+        with phase("stream columns"):
+            res1, res2 = stream_totals(buffer)
+        answer(1, res1)
+        answer(2, res2)
+        return
+
+    # Use example.txt as default if no stdin provided
+    if sys.stdin.isatty():
+        input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
+    else:
+        input_file = sys.stdin
+
+    # Both parts read the same lines, so stdin only has to be read once
+    with phase("parse"):
+        lines = parse(input_file.read())
+
+    # print(f"Part 1: {part1(lines)}")
+    with phase("part 2"):
+        res2 = part2(lines)
+    answer(2, res2)
+
+
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
@@ -2,6 +2,16 @@
 import sys
 import os
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.log import answer, answer_table, get_logger
+from path_table import PathTable
+
+log = get_logger("day07")
+
 def parse_input(input_file):
     """Parse input file into a grid."""
     grid = []
@@ -17,10 +27,10 @@ def part1(grid):
         start_col = grid[0].find('S')
 
     if start_col == -1:
-        print("No starting position 'S' found!")
+        log.error("No starting position 'S' found!")
         return 0
 
-    print(f"Starting position: row=0, col={start_col}")
+    log.info("Starting position: row=0, col=%d", start_col)
 
     split_count = 0
     beams = {start_col}  # Set of column positions where beams are currently
@@ -80,18 +90,110 @@ def part2(grid):
     total_paths = sum(current_paths.values())
     return total_paths
 
-# Use example.txt as default if no stdin provided
-script_dir = os.path.dirname(os.path.abspath(__file__))
+def part1_table(grid):
+    """part1 as a lookup in the all-columns table."""
+    return PathTable.build(grid).splits_from(grid[0].find('S') if grid else -1)
+
+def part2_table(grid):
+    """part2 as a lookup in the all-columns table."""
+    return PathTable.build(grid).paths_from(grid[0].find('S') if grid else -1)
+
+def simulate_stream(lines):
+    """Both parts in one pass over an iterable of rows, keeping only the current row.
+
+    The part 1 beam set and the part 2 path counts are advanced together,
+    with the same rules as part1 and part2, so memory is O(width) however
+    tall the manifold is.
+    """
+    lines = iter(lines)
+    first = next(lines, '')
+    start_col = first.find('S')
+    if start_col == -1:
+        log.error("No starting position 'S' found!")
+        return 0, 0
+
+    split_count = 0
+    beams = {start_col}
+    paths = {start_col: 1}
+    rows = 0
+    for row in lines:
+        row = row.rstrip('\n')
+        rows += 1
+
+        for beam in beams.copy():
+            if row[beam] == '^':
+                split_count += 1
+                beams.add(beam - 1)
+                beams.add(beam + 1)
+                beams.remove(beam)
+
+        next_paths = {}
+        for col, path_count in paths.items():
+            if col >= len(row):
+                continue
+            cell = row[col]
+            if cell == '.':
+                next_paths[col] = next_paths.get(col, 0) + path_count
+            elif cell == '^':
+                if col - 1 >= 0:
+                    next_paths[col - 1] = next_paths.get(col - 1, 0) + path_count
+                if col + 1 < len(row):
+                    next_paths[col + 1] = next_paths.get(col + 1, 0) + path_count
+        paths = next_paths
+
+    log.info("Streamed %d rows", rows + 1)
+    return split_count, sum(paths.values())
+
+def parse(text):
+    return parse_input(text.splitlines())
+
+def solve(text):
+    grid = parse(text)
+    return part1(grid), part2(grid)
+
+def add_arguments(parser):
+    parser.add_argument('--stream', action='store_true',
+                        help="solve both parts in one pass, reading a row at a time")
+    parser.add_argument('--columns', type=int, nargs='+', metavar='COL',
+                        help="also report paths and splits for a beam starting in these columns")
+    parser.add_argument('--table', metavar='PATH',
+                        help="keep the all-columns table in this file and reuse it while the grid matches")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided
+    if sys.stdin.isatty():
+        input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
+    else:
+        input_file = sys.stdin
+
+    if args.stream:
+        with phase("stream"):
+            res1, res2 = simulate_stream(input_file)
+        answer(1, res1)
+        answer(2, res2)
+        return
+
+    with phase("parse"):
+        grid = parse_input(input_file)
+    log.info("Grid loaded: %d rows", len(grid))
+    if grid:
+        log.debug("First row: '%s'", grid[0])
+
+    with phase("part 1"):
+        res1 = part1(grid)
+    answer(1, res1)
+    with phase("part 2"):
+        res2 = part2(grid)
+    answer(2, res2)
 
-if sys.stdin.isatty():
-    input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
-else:
-    input_file = sys.stdin
+    if args.columns:
+        with phase("path table"):
+            table = PathTable.cached(grid, args.table)
+        answer_table('columns', ['column', 'paths', 'splits'],
+                     [(col, table.paths_from(col), table.splits_from(col)) for col in args.columns])
 
-grid = parse_input(input_file)
-print(f"Grid loaded: {len(grid)} rows")
-if grid:
-    print(f"First row: '{grid[0]}'")
 
-print(f"Part 1: {part1(grid)}")
-print(f"Part 2: {part2(grid)}")
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
@@ -0,0 +1,160 @@
+"""Bottom-up path counts and split counts for every start column at once."""
+
+import hashlib
+import json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SPLITTER = ord('^')
+EMPTY = ord('.')
+INT64_SAFE = 1 << 61  # A row at most doubles a count, so stay well below 2**63
+
+
+def grid_digest(grid: list[str]) -> str:
+    return hashlib.sha256('\n'.join(grid).encode()).hexdigest()
+
+
+def _path_counts_numpy(rows: list[str], width: int) -> list[int]:
+    counts = np.ones(width, dtype=np.int64)
+    for row in reversed(rows):
+        cells = np.frombuffer(row.encode().ljust(width, b' '), dtype=np.uint8)
+        # Counts from the column to the left and right of every cell
+        left = np.zeros_like(counts)
+        left[1:] = counts[:-1]
+        right = np.zeros_like(counts)
+        if len(row) > 1:
+            right[:len(row) - 1] = counts[1:len(row)]
+        counts = np.where(cells == EMPTY, counts, np.where(cells == SPLITTER, left + right, 0))
+        # Fall back to Python ints before int64 could overflow
+        if counts.dtype != object and counts.max(initial=0) > INT64_SAFE:
+            counts = counts.astype(object)
+    return [int(count) for count in counts]
+
+
+def _path_counts_lists(rows: list[str], width: int) -> list[int]:
+    counts = [1] * width
+    for row in reversed(rows):
+        limit = len(row)
+        counts = [
+            counts[c] if row[c] == '.'
+            else (counts[c - 1] if c > 0 else 0) + (counts[c + 1] if c + 1 < limit else 0) if row[c] == '^'
+            else 0
+            for c in range(limit)
+        ] + [0] * (width - limit)
+    return counts
+
+
+def _split_counts_numpy(rows: list[str], width: int) -> list[int]:
+    """Distinct splitters reached from every column, via packed bitsets.
+
+    Beams that meet merge, so reached splitters are a union rather than a
+    sum. Each column carries a bitset with a bit per splitter below it, as
+    a row of uint64 words; column c lives at index c + 1 so its neighbours
+    always exist. Like part1, a beam passes through any cell that is not a
+    splitter, so a row only rewrites its splitter columns: it gathers their
+    neighbours' sets for all of them at once, then scatters the unions back.
+    """
+    splitter_cols = []
+    for row in reversed(rows):
+        cells = np.frombuffer(row.encode(), dtype=np.uint8)
+        splitter_cols.append(np.flatnonzero(cells == SPLITTER))
+    total = sum(len(cols) for cols in splitter_cols)
+
+    reached = np.zeros((width + 2, max(1, (total + 63) // 64)), dtype=np.uint64)
+    bit = 0
+    for row, cols in zip(reversed(rows), splitter_cols):
+        # Beams do not pass columns past the end of a short row
+        reached[len(row) + 1:] = 0
+        if not len(cols):
+            continue
+        # Only the words holding splitters seen so far can be non-zero
+        used = (bit + len(cols) + 63) // 64
+        unions = reached[cols, :used] | reached[cols + 2, :used]
+        # A split past the end of a short row goes nowhere, as in part1
+        short = cols + 1 >= len(row)
+        unions[short] = reached[cols[short], :used]
+        bits = np.arange(bit, bit + len(cols))
+        unions[np.arange(len(cols)), bits // 64] |= np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64))
+        reached[cols + 1, :used] = unions
+        bit += len(cols)
+
+    counts = np.unpackbits(reached[1:width + 1].view(np.uint8), axis=1).sum(axis=1)
+    return [int(count) for count in counts]
+
+
+def _split_counts_lists(rows: list[str], width: int) -> list[int]:
+    """_split_counts_numpy with one big int bitset per column."""
+    reached = [0] * width
+    bit = 1
+    for row in reversed(rows):
+        reached[len(row):] = [0] * (width - len(row))
+        cols = [c for c, cell in enumerate(row) if cell == '^']
+        unions = [(reached[c - 1] if c > 0 else 0) | (reached[c + 1] if c + 1 < len(row) else 0)
+                  for c in cols]
+        for c, union in zip(cols, unions):
+            reached[c] = bit | union
+            bit <<= 1
+    return [mask.bit_count() for mask in reached]
+
+
+class PathTable:
+    """Paths to the bottom and splitters hit, for a beam entering at each column.
+
+    The beam starts in the top row (where S sits) and is moved down from the
+    second row on, exactly as part1 and part2 do. For the S column the
+    lookups equal their results on grids without two splitters side by
+    side, like the real input. Where splitters touch, part1's count depends
+    on the order it visits its beam set; splits here always land in the row
+    below, so splits_from can differ from part1 (paths_from still equals
+    part2).
+    """
+
+    def __init__(self, paths: list[int], splits: list[int], digest: str):
+        self.paths = paths
+        self.splits = splits
+        self.digest = digest
+
+    @classmethod
+    def build(cls, grid: list[str]) -> 'PathTable':
+        rows = grid[1:]
+        width = max((len(row) for row in grid), default=0)
+        if np is not None:
+            paths, splits = _path_counts_numpy(rows, width), _split_counts_numpy(rows, width)
+        else:
+            paths, splits = _path_counts_lists(rows, width), _split_counts_lists(rows, width)
+        return cls(paths, splits, grid_digest(grid))
+
+    def paths_from(self, col: int) -> int:
+        return self.paths[col] if 0 <= col < len(self.paths) else 0
+
+    def splits_from(self, col: int) -> int:
+        return self.splits[col] if 0 <= col < len(self.splits) else 0
+
+    def save(self, path: str):
+        with open(path, 'w') as table_file:
+            json.dump({'digest': self.digest, 'paths': self.paths, 'splits': self.splits}, table_file)
+
+    @classmethod
+    def load(cls, path: str, grid: list[str]) -> 'PathTable | None':
+        """The table stored at `path`, or None if it is missing or for another grid."""
+        try:
+            with open(path) as table_file:
+                stored = json.load(table_file)
+        except (OSError, ValueError):
+            return None
+        if stored.get('digest') != grid_digest(grid):
+            return None
+        return cls(stored['paths'], stored['splits'], stored['digest'])
+
+    @classmethod
+    def cached(cls, grid: list[str], path: str | None = None) -> 'PathTable':
+        """Load the table from `path` when it matches the grid, else build (and save) it."""
+        table = cls.load(path, grid) if path else None
+        if table is None:
+            table = cls.build(grid)
+            if path:
+                table.save(path)
+        return table
@@ -1,8 +1,21 @@
 #!/usr/bin/env python3
 import sys
 import os
+import logging
 from math import sqrt
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import int_tuples, load_default
+from aoc25.log import answer, answer_table, get_logger
+from merge_log import MergeLog
+from online_circuits import OnlineCircuits
+
+log = get_logger("day08")
+
 MAX_CONNECTIONS = 1000
 
 class UnionFind:
@@ -54,17 +67,11 @@ class UnionFind:
                 sets[root] = []
             sets[root].append(i)
         for root, members in sets.items():
-            print(f"Root {root}: Members {members}")
-
-def parse_input(input_file):
-    """Parse input file into list of 3D coordinates."""
-    boxes = []
-    for line in input_file:
-        line = line.strip()
-        if line:
-            x, y, z = map(int, line.split(','))
-            boxes.append((x, y, z))
-    return boxes
+            log.debug("Root %d: Members %s", root, members)
+
+def parse_input(data):
+    """Parse the input buffer into a list of 3D coordinates."""
+    return int_tuples(data, 3, signed=True)
 
 def euclidean_distance(box1, box2):
     """Calculate Euclidean distance between two 3D points."""
@@ -72,8 +79,23 @@ def euclidean_distance(box1, box2):
     x2, y2, z2 = box2
     return sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
 
-def part1(boxes, distances):
+def build_distances(boxes):
+    """All box pairs as (distance, i, j), closest first."""
+    distances = []
+    with phase("pair distances"):
+        for i in range(len(boxes)):
+            for j in range(i + 1, len(boxes)):
+                dist = euclidean_distance(boxes[i], boxes[j])
+                distances.append((dist, i, j))
+
+    # Sort by distance (smallest first)
+    with phase("sort pairs"):
+        distances.sort()
+    return distances
+
+def part1(data):
     """Connect 1000 closest pairs and find product of 3 largest circuits."""
+    boxes, distances = data
     # Step 3: Initialize Union-Find
     uf = UnionFind(len(boxes))
 
@@ -86,20 +108,21 @@ def part1(boxes, distances):
 
     # Step 5: Get circuit sizes and find product of 3 largest
     circuit_sizes = uf.get_circuit_sizes()
-    print(f"Number of circuits: {len(circuit_sizes)}")
-    print(f"Circuit sizes: {sorted(circuit_sizes, reverse=True)[:10]}")  # Show top 10
     circuit_sizes.sort(reverse=True)
+    log.info("Number of circuits: %d", len(circuit_sizes))
+    log.info("Circuit sizes: %s", circuit_sizes[:10])  # Show top 10
 
     # Product of 3 largest
     if len(circuit_sizes) < 3:
-        print(f"ERROR: Only {len(circuit_sizes)} circuits found, need at least 3")
+        log.error("Only %d circuits found, need at least 3", len(circuit_sizes))
         return 0
 
     result = circuit_sizes[0] * circuit_sizes[1] * circuit_sizes[2]
     return result
 
-def part2(boxes, distances):
-    """Part 2 solution - to be implemented."""
+def part2(data):
+    """Connect closest pairs until every box is in one circuit."""
+    boxes, distances = data
     uf = UnionFind(len(boxes))
 
     # Step 4: Try to connect the 1000 closest pairs
@@ -111,28 +134,66 @@ def part2(boxes, distances):
             last_x_axis = boxes[box2][0]
         if len(uf.get_circuit_sizes()) == 1:
             break
-    print(f"All boxes connected at x={last_x_axis}, previous x={second_last_x_axis} ")
+    log.info("All boxes connected at x=%d, previous x=%d", last_x_axis, second_last_x_axis)
     return last_x_axis * second_last_x_axis
 
-# Use example.txt as default if no stdin provided
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-if sys.stdin.isatty():
-    input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
-else:
-    input_file = sys.stdin
-
-boxes = parse_input(input_file)
-distances = []
-for i in range(len(boxes)):
-    for j in range(i + 1, len(boxes)):
-        dist = euclidean_distance(boxes[i], boxes[j])
-        distances.append((dist, i, j))
-
-# Step 2: Sort by distance (smallest first)
-distances.sort()
-res1 = part1(boxes, distances)
-print(f"Part 1: {res1}")
-
-res2 = part2(boxes, distances)
-print(f"Part 2: {res2}")
+def parse(data):
+    """Parse boxes and pre-compute the sorted pair distances both parts share."""
+    boxes = parse_input(data)
+    return boxes, build_distances(boxes)
+
+def solve(text):
+    data = parse(text)
+    return part1(data), part2(data)
+
+def connect_online(boxes):
+    """part1's product, kept up to date while boxes arrive one at a time."""
+    circuits = OnlineCircuits(MAX_CONNECTIONS)
+    debug = log.isEnabledFor(logging.DEBUG)
+    for box in boxes:
+        index = circuits.add(box)
+        if debug:
+            log.debug("Box %d at %s: product %d", index, box, circuits.product())
+    return circuits.product()
+
+def add_arguments(parser):
+    parser.add_argument('--online', action='store_true',
+                        help="insert boxes one at a time and keep the part 1 product current (part 1 only)")
+    parser.add_argument('--thresholds', type=int, nargs='+', metavar='N',
+                        help="also report the part 1 product after each of these numbers of connections")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided
+    data = load_default(script_dir)
+
+    if args.online:
+        with phase("parse"):
+            boxes = parse_input(data)
+        with phase("online"):
+            res1 = connect_online(boxes)
+        answer(1, res1)
+        return
+
+    with phase("parse"):
+        data = parse(data)
+    with phase("part 1"):
+        res1 = part1(data)
+    answer(1, res1)
+
+    with phase("part 2"):
+        res2 = part2(data)
+    answer(2, res2)
+
+    if args.thresholds:
+        boxes, distances = data
+        with phase("thresholds"):
+            merges = MergeLog.record(len(boxes), distances, max(args.thresholds))
+            products = merges.products(args.thresholds)
+        log.info("%d merges among the first %d pairs", len(merges.events), max(args.thresholds))
+        answer_table('thresholds', ['connections', 'product'], zip(args.thresholds, products))
+
+
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
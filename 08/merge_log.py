@@ -0,0 +1,99 @@
+"""part1's product at many connection counts from one pass over the sorted pairs."""
+
+import heapq
+
+from bisect import bisect_right
+
+
+class SizeMultiset:
+    """Circuit sizes with their counts, plus a lazy max-heap of the distinct sizes."""
+
+    def __init__(self, boxes: int):
+        self.counts = {1: boxes} if boxes else {}
+        self.heap = [-1] if boxes else []
+
+    def add(self, size: int):
+        count = self.counts.get(size, 0)
+        if not count:
+            heapq.heappush(self.heap, -size)
+        self.counts[size] = count + 1
+
+    def remove(self, size: int):
+        count = self.counts[size] - 1
+        if count:
+            self.counts[size] = count
+        else:
+            del self.counts[size]
+
+    def largest(self, count: int = 3) -> list[int]:
+        """The `count` largest sizes, repeats included."""
+        sizes = []
+        kept = set()
+        while self.heap and len(sizes) < count:
+            size = -heapq.heappop(self.heap)
+            # Sizes whose last circuit merged away, or that were pushed again
+            # after coming back, are dropped here
+            if size in self.counts and size not in kept:
+                kept.add(size)
+                sizes.extend([size] * min(self.counts[size], count - len(sizes)))
+        for size in kept:
+            heapq.heappush(self.heap, -size)
+        return sizes
+
+
+class MergeLog:
+    """Every merge among the closest pairs, as (pair rank, size, size).
+
+    Pairs that join two boxes already in one circuit change nothing and
+    leave no entry, so the log has fewer than `boxes` entries however many
+    pairs are replayed.
+    """
+
+    def __init__(self, boxes: int, events: list[tuple[int, int, int]]):
+        self.boxes = boxes
+        self.events = events
+
+    @classmethod
+    def record(cls, boxes: int, distances, limit: int) -> 'MergeLog':
+        """Replay the first `limit` pairs of `distances` once, keeping the merges."""
+        parent = list(range(boxes))
+        size = [1] * boxes
+
+        def find(x):
+            root = x
+            while parent[root] != root:
+                root = parent[root]
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        events = []
+        for rank, (_, box1, box2) in enumerate(distances):
+            if rank >= limit or len(events) == boxes - 1:
+                break
+            root1, root2 = find(box1), find(box2)
+            if root1 == root2:
+                continue
+            events.append((rank, size[root1], size[root2]))
+            if size[root1] < size[root2]:
+                root1, root2 = root2, root1
+            parent[root2] = root1
+            size[root1] += size[root2]
+        return cls(boxes, events)
+
+    def products(self, thresholds: list[int]) -> list[int]:
+        """part1's product after each number of connections, in the given order."""
+        sizes = SizeMultiset(self.boxes)
+        results = {}
+        done = 0
+        for threshold in sorted(set(thresholds)):
+            # Merges made by the first `threshold` pairs
+            stop = bisect_right(self.events, (threshold - 1, self.boxes, self.boxes))
+            for _, size1, size2 in self.events[done:stop]:
+                sizes.remove(size1)
+                sizes.remove(size2)
+                sizes.add(size1 + size2)
+            done = stop
+            largest = sizes.largest(3)
+            results[threshold] = largest[0] * largest[1] * largest[2] if len(largest) == 3 else 0
+        return [results[threshold] for threshold in thresholds]
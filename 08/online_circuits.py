@@ -0,0 +1,165 @@
+"""Circuits of the closest box pairs, kept up to date as boxes arrive."""
+
+import heapq
+
+from math import sqrt, inf
+
+
+def distance(box1, box2) -> float:
+    # Same float as main.euclidean_distance: the squared distance is an exact int
+    x1, y1, z1 = box1
+    x2, y2, z2 = box2
+    return sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
+
+
+class SizeUnionFind:
+    """Union-find over whichever boxes appear in an edge, tracking circuit sizes."""
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def find(self, x):
+        parent = self.parent
+        if x not in parent:
+            parent[x] = x
+            self.size[x] = 1
+            return x
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, x, y):
+        """Returns the new root if two circuits merged, else None."""
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            return None
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size.pop(root_y)
+        return root_x
+
+
+class OnlineCircuits:
+    """The `max_connections` closest pairs and their circuits, under insertion.
+
+    Boxes sit in a spatial hash of cubic cells. Once `max_connections`
+    pairs are known, only boxes within the current longest kept distance
+    can form a new pair, so an insertion looks at a few cells instead of
+    every box. Kept pairs are a bounded max-heap ordered like part1's
+    sorted list, (distance, i, j), so the same pairs win ties.
+
+    The union-find only holds boxes that appear in a kept pair, and every
+    other box is a circuit of one. When a new pair pushes an old one out,
+    circuits may split, so the union-find is rebuilt from the kept pairs.
+    Either way an insertion costs O(max_connections + nearby boxes), no
+    matter how many boxes there are.
+    """
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self.boxes = []
+        self.edges = []  # max-heap of kept pairs as (-distance, -i, -j)
+        self.cell_size = None
+        self.cells = {}
+        self.circuits = SizeUnionFind()
+        self.top_sizes = []  # max-heap of (-size, root), stale entries skipped lazily
+
+    @property
+    def radius(self) -> float:
+        if len(self.edges) < self.max_connections:
+            return inf
+        return -self.edges[0][0]
+
+    def _cell(self, box) -> tuple[int, int, int]:
+        size = self.cell_size
+        return box[0] // size, box[1] // size, box[2] // size
+
+    def _rehash(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells = {}
+        for i, box in enumerate(self.boxes):
+            self.cells.setdefault(self._cell(box), []).append(i)
+
+    def _nearby(self, box, radius: float):
+        """Indices of boxes that could be within `radius` of `box`."""
+        if radius == inf or self.cell_size is None:
+            return range(len(self.boxes))
+        reach = int(radius // self.cell_size) + 1
+        cx, cy, cz = self._cell(box)
+        found = []
+        for x in range(cx - reach, cx + reach + 1):
+            for y in range(cy - reach, cy + reach + 1):
+                for z in range(cz - reach, cz + reach + 1):
+                    found.extend(self.cells.get((x, y, z), ()))
+        return found
+
+    def add(self, box) -> int:
+        """Insert a box; returns its index."""
+        new = len(self.boxes)
+        added = []
+        evicted = False
+        for j in self._nearby(box, self.radius):
+            key = (-distance(self.boxes[j], box), -j, -new)
+            if len(self.edges) < self.max_connections:
+                heapq.heappush(self.edges, key)
+                added.append((j, new))
+            elif key > self.edges[0]:
+                # Closer than the longest kept pair, which drops out
+                heapq.heapreplace(self.edges, key)
+                added.append((j, new))
+                evicted = True
+
+        self.boxes.append(box)
+        radius = self.radius
+        if radius != inf:
+            # Keep cells about one radius wide, so a lookup touches 27 of them
+            if self.cell_size is None or radius < self.cell_size / 2:
+                self._rehash(max(1, int(radius)))
+            else:
+                self.cells.setdefault(self._cell(box), []).append(new)
+
+        if evicted:
+            self._rebuild()
+        else:
+            for i, j in added:
+                root = self.circuits.union(i, j)
+                if root is not None:
+                    heapq.heappush(self.top_sizes, (-self.circuits.size[root], root))
+        return new
+
+    def _rebuild(self):
+        self.circuits = SizeUnionFind()
+        for _, i, j in self.edges:
+            self.circuits.union(-i, -j)
+        self.top_sizes = [(-size, root) for root, size in self.circuits.size.items()]
+        heapq.heapify(self.top_sizes)
+
+    def largest_sizes(self, count: int = 3) -> list[int]:
+        """Sizes of the `count` largest circuits, singletons included."""
+        sizes = []
+        seen = []
+        while self.top_sizes and len(sizes) < count:
+            entry = heapq.heappop(self.top_sizes)
+            neg_size, root = entry
+            # Skip roots that were merged away or have grown since
+            if self.circuits.size.get(root) == -neg_size:
+                sizes.append(-neg_size)
+                seen.append(entry)
+        for entry in seen:
+            heapq.heappush(self.top_sizes, entry)
+
+        singletons = len(self.boxes) - len(self.circuits.parent)
+        sizes.extend([1] * min(singletons, count - len(sizes)))
+        return sizes
+
+    def product(self) -> int:
+        """part1's answer for the boxes seen so far (0 with fewer than 3 circuits)."""
+        sizes = self.largest_sizes(3)
+        if len(sizes) < 3:
+            return 0
+        return sizes[0] * sizes[1] * sizes[2]
@@ -2,58 +2,25 @@
 
 import sys
 import os
+from bisect import bisect_left, bisect_right
+from functools import partial
 
-class Rectangle:
-    def __init__(self, p1, p2):
-        self.p1 = p1  # (x1, y1)
-        self.p2 = p2  # (x2, y2)
-
-    @property
-    def area(self):
-        width = abs(self.p2[0] - self.p1[0]) + 1
-        height = abs(self.p2[1] - self.p1[1]) + 1
-        return width * height
-    
-
-    def get_rectangle_edge_points(self):
-        x1, y1 = self.p1
-        x2, y2 = self.p2
-        edges = [
-            ((x1, y1), (x2, y1)),  
-            ((x2, y1), (x2, y2)),  
-            ((x2, y2), (x1, y2)),  
-            ((x1, y2), (x1, y1)),  
-        ]
-        edges_points = []
-        for edge in edges:
-            (ex1, ey1), (ex2, ey2) = edge
-            if ex1 == ex2:  # Vertical edge
-                for y in range(min(ey1, ey2), max(ey1, ey2) + 1):
-                    edges_points.append((ex1, y))
-            else:  # Horizontal edge
-                for x in range(min(ex1, ex2), max(ex1, ex2) + 1):
-                    edges_points.append((x, ey1))   
-        return edges_points
-
-
-    def get_rectangle_points(self):
-        x1, y1 = self.p1
-        x2, y2 = self.p2
-        points = []
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            for y in range(min(y1, y2), max(y1, y2) + 1):
-                points.append((x, y))
-        return points
-
-def parse_input(input_file):
-    """Parse input file into list of 2D coordinates."""
-    points = []
-    for line in input_file:
-        line = line.strip()
-        if line:
-            x, y = map(int, line.split(','))
-            points.append((x, y))
-    return points
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import int_tuples, load_default
+from aoc25.log import answer, get_logger
+from main_fast import interval_reach, is_rectangle_valid, precompute_valid_points_scanline
+from polygon_index import PolygonIndex
+from rectangle_search import find_largest_rectangle
+
+log = get_logger("day09")
+
+def parse_input(data):
+    """Parse the input buffer into a list of 2D coordinates."""
+    return int_tuples(data, 2, signed=True)
 
 def part1(points):
     """Find the largest rectangle using given points as opposite corners."""
@@ -76,9 +43,9 @@ def part1(points):
                 max_area = area
                 best_corners = (points[i], points[j])
 
-    print(f"Largest rectangle area: {max_area}")
+    log.info("Largest rectangle area: %d", max_area)
     if best_corners:
-        print(f"Opposite corners: {best_corners[0]} and {best_corners[1]}")
+        log.info("Opposite corners: %s and %s", best_corners[0], best_corners[1])
 
     return max_area
 
@@ -90,138 +57,277 @@ def build_polygon(points):
         edges.append((p1, p2))
     return edges
 
-def is_point_on_edge(point, edges):
-    for edge in edges:
-        if is_point_on_line_segment(point, edge):
-            return True
-    return False
-
-def is_point_on_line_segment(point, line_segment):
-    (x1, y1), (x2, y2) = line_segment
-    (px, py) = point
-
-    # Check if point is within bounding box of edge
-    if min(x1, x2) <= px <= max(x1, x2) and min(y1, y2) <= py <= max(y1, y2):
-        # Check collinearity using cross product
-        return (y2 - y1) * (px - x1) == (x2 - x1) * (py - y1)
-    return False
-
-def is_point_inside_polygon(point, polygon_edges):
-    if is_point_on_edge(point, polygon_edges):
-        return True  # On edge is considered inside
-
-    # Ray-casting algorithm to check if point is inside polygon
-    x_intersections = 0
-    for edge in polygon_edges:
-        if does_ray_intersect_segment(point, edge):
-            x_intersections += 1
-
-    return x_intersections % 2 == 1  # Inside if odd number of intersections
-
-def does_ray_intersect_segment(point, line_segment):
-    (x1, y1), (x2, y2) = line_segment
-    (px, py) = point
-
-    if y1 > y2:
-        x1, y1, x2, y2 = x2, y2, x1, y1
-
-    if py == y1 or py == y2:
-        py += 0.1  # Slightly adjust point to avoid ambiguity
-
-    if py < y1 or py > y2:
-        return False
-
-    if x1 == x2:  # Vertical line
-        return px <= x1
-
-    # Calculate intersection point
-    slope = (y2 - y1) / (x2 - x1)
-    x_intersect = x1 + (py - y1) / slope
-
-    return px <= x_intersect
-
-def build_rectangles(points):
-    rectangles = set()
-    for i in range(len(points)):
-        for j in range(i + 1, len(points)):
-            rect = Rectangle(points[i], points[j])
-            rectangles.add(rect)
-    rectangles = sorted(rectangles, key=lambda r: r.area, reverse=True)
-    return rectangles
-
-
-def part2(points):
-    """Part 2 solution with point caching."""
-
-    # Build polygon from points
-    polygon_edges = build_polygon(points)
-    rectangles = build_rectangles(points)
-
-    # Cache for point-in-polygon test results
-    invalid_points = set()  # Points known to be outside polygon
-    valid_points = set()    # Points known to be inside polygon
-
-    # Pre-populate valid_points with input points (they're on polygon boundary)
-    for p in points:
-        valid_points.add(p)
-
-    print(f"Total rectangles: {len(rectangles)}")
-
-    for i, rect in enumerate(rectangles):
-        # Progress update every 100 rectangles
-        # if i % 10 == 0:
-        print(f"Checked {i}/{len(rectangles)} rectangles... (cache: {len(valid_points)} valid, {len(invalid_points)} invalid)")
-
-        rect_edge_points = rect.get_rectangle_edge_points()
-        valid = True
-
-        for rp in rect_edge_points:
-            # Quick rejection if we know it's invalid
-            if rp in invalid_points:
-                valid = False
-                continue
-
-            # Skip check if we know it's valid
-            if rp in valid_points:
-                continue
-
-            # Need to test this point
-            if is_point_inside_polygon(rp, polygon_edges):
-                valid_points.add(rp)
+def _any_between(values, lo, hi):
+    """Check if the sorted list `values` has an element strictly between lo and hi."""
+    return bisect_right(values, lo) < bisect_left(values, hi)
+
+class SpanTree:
+    """Parallel edges as a segment tree over their span end points and the gaps between.
+
+    Leaf 2k is the k-th distinct end point and leaf 2k+1 the open gap after
+    it, so an open span and a closed query range are both runs of leaves.
+    Each edge is stored at the O(log n) nodes that together cover its span
+    ("own"), and every node also keeps the fixed coordinates of all edges
+    stored at or below it ("below"), sorted. An edge crosses a box when one
+    of its nodes meets the box's span: that node lies under one of the
+    O(log n) nodes covering the box's leaves, or is an ancestor of the
+    first or last of them. One bisect per node makes a query O(log^2 n),
+    however many edges are in range.
+    """
+    def __init__(self, edges):
+        """`edges` are (fixed, span start, span end) triples."""
+        self.bounds = sorted({value for _, lo, hi in edges for value in (lo, hi)})
+        self.leaves = max(2 * len(self.bounds) - 1, 0)
+        self.size = 1
+        while self.size < self.leaves:
+            self.size *= 2
+        self.own = [[] for _ in range(2 * self.size)]
+        self.below = [[] for _ in range(2 * self.size)]
+
+        for fixed, lo, hi in edges:
+            marked = set()
+            for node in self.cover(self.leaf(lo) + 1, self.leaf(hi) - 1):
+                self.own[node].append(fixed)
+                while node and node not in marked:
+                    marked.add(node)
+                    self.below[node].append(fixed)
+                    node >>= 1
+        for values in self.own + self.below:
+            values.sort()
+
+    def leaf(self, value):
+        """The leaf holding `value`: -1 below every end point, self.leaves above."""
+        k = bisect_left(self.bounds, value)
+        if k < len(self.bounds) and self.bounds[k] == value:
+            return 2 * k
+        return 2 * k - 1
+
+    def cover(self, first, last):
+        """The nodes that together cover leaves first..last."""
+        nodes = []
+        lo, hi = first + self.size, last + self.size + 1
+        while lo < hi:
+            if lo & 1:
+                nodes.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                nodes.append(hi)
+            lo >>= 1
+            hi >>= 1
+        return nodes
+
+    def crosses(self, fixed_min, fixed_max, span_min, span_max):
+        """Check if an edge strictly between the fixed bounds meets [span_min, span_max] off its ends."""
+        first = max(self.leaf(span_min), 0)
+        last = min(self.leaf(span_max), self.leaves - 1)
+        if first > last:
+            return False
+        for leaf in (first + self.size, last + self.size):
+            node = leaf
+            while node:
+                if _any_between(self.own[node], fixed_min, fixed_max):
+                    return True
+                node >>= 1
+        return any(_any_between(self.below[node], fixed_min, fixed_max)
+                   for node in self.cover(first, last))
+
+class EdgeIndex:
+    """Rectilinear polygon edges indexed by their fixed coordinate.
+
+    Vertical edges are kept sorted by x and horizontal edges by y, and each
+    set also goes into a SpanTree, so whether any edge crosses a box is
+    found in O(log^2 n) whatever the box's size. A rectangle is inside the
+    polygon when no edge passes through its interior and one interior
+    sample point is inside; nothing is allocated per lattice point.
+
+    The test is continuous, while the puzzle counts lattice tiles. The two
+    only differ when an outside gap one unit wide (two parallel edges one
+    apart) has no lattice point in it: the tiles on both sides are all on
+    the boundary, yet the edges cross the rectangle. has_narrow_gaps()
+    finds such edge pairs so callers can use a lattice-exact check instead.
+    """
+    def __init__(self, polygon_edges):
+        vertical = []    # (x, y_min, y_max)
+        horizontal = []  # (y, x_min, x_max)
+        for (x1, y1), (x2, y2) in polygon_edges:
+            if x1 == x2:
+                vertical.append((x1, min(y1, y2), max(y1, y2)))
+            elif y1 == y2:
+                horizontal.append((y1, min(x1, x2), max(x1, x2)))
             else:
-                invalid_points.add(rp)
-                valid = False
-                continue
-
-        # Check interior points (only if edges passed)
-        for rp in rect.get_rectangle_points():
-            if rp in invalid_points:
-                valid = False
-                continue
+                raise ValueError(f"Edge {(x1, y1)} -> {(x2, y2)} is not axis-aligned")
+        vertical.sort()
+        horizontal.sort()
+
+        # Parallel sorted arrays: position -> fixed coordinate, span start, span end
+        self.vertical_x = [x for x, _, _ in vertical]
+        self.vertical_lo = [lo for _, lo, _ in vertical]
+        self.vertical_hi = [hi for _, _, hi in vertical]
+        self.horizontal_y = [y for y, _, _ in horizontal]
+        self.horizontal_lo = [lo for _, lo, _ in horizontal]
+        self.horizontal_hi = [hi for _, _, hi in horizontal]
+        self.vertical_tree = SpanTree(vertical)
+        self.horizontal_tree = SpanTree(horizontal)
+
+        # Doubled coordinates keep midpoints between lattice points integral
+        self.doubled = PolygonIndex([(2 * x, 2 * y) for (x, y), _ in polygon_edges])
+
+    def crosses_interior(self, min_x, min_y, max_x, max_y):
+        """Check if any edge passes through the open box (min_x, max_x) x (min_y, max_y)."""
+        return (self.vertical_tree.crosses(min_x, max_x, min_y, max_y)
+                or self.horizontal_tree.crosses(min_y, max_y, min_x, max_x))
+
+    def has_narrow_gaps(self):
+        """Check for parallel edges one unit apart whose spans overlap.
+
+        Conservative: the strip between them may well be inside, in which
+        case the continuous test would have been exact anyway.
+        """
+        for coords, starts, ends in ((self.vertical_x, self.vertical_lo, self.vertical_hi),
+                                     (self.horizontal_y, self.horizontal_lo, self.horizontal_hi)):
+            for i, fixed in enumerate(coords):
+                for j in range(bisect_left(coords, fixed + 1), bisect_right(coords, fixed + 1)):
+                    if max(starts[i], starts[j]) < min(ends[i], ends[j]):
+                        return True
+        return False
 
-            if rp in valid_points:
+    def segment_breakpoints(self, fixed, lo, hi, vertical):
+        """Polygon vertices strictly inside a degenerate (line) rectangle."""
+        if vertical:
+            coords, starts, ends = self.vertical_x, self.vertical_lo, self.vertical_hi
+        else:
+            coords, starts, ends = self.horizontal_y, self.horizontal_lo, self.horizontal_hi
+
+        breakpoints = []
+        for i in range(bisect_left(coords, fixed), bisect_right(coords, fixed)):
+            for value in (starts[i], ends[i]):
+                if lo < value < hi:
+                    breakpoints.append(value)
+        return sorted(breakpoints)
+
+    def nearest_crossing(self, coords, starts, ends, position, fixed, step):
+        """Distance from `position` to the nearest edge crossing the line at `fixed`.
+
+        Only edges whose span strictly contains `fixed` count: the line
+        passes through them instead of touching an end point.
+        """
+        if step > 0:
+            indices = range(bisect_right(coords, position), len(coords))
+        else:
+            indices = range(bisect_left(coords, position) - 1, -1, -1)
+        for i in indices:
+            if starts[i] < fixed < ends[i]:
+                return abs(coords[i] - position)
+        return None
+
+    def reach(self, x, y, bounds):
+        """How far the polygon extends from vertex (x, y): (left, right, down, up).
+
+        Each value is an upper bound - walking further in that direction
+        leaves the polygon - so it can be used to prune rectangles.
+        """
+        min_x, min_y, max_x, max_y = bounds
+        result = []
+        for dx, dy, limit in ((-1, 0, x - min_x), (1, 0, max_x - x),
+                              (0, -1, y - min_y), (0, 1, max_y - y)):
+            # Step half a unit first: if that is already outside, reach is 0
+            if not self.doubled.is_inside(2 * x + dx, 2 * y + dy):
+                result.append(0)
                 continue
-
-            if is_point_inside_polygon(rp, polygon_edges):
-                valid_points.add(rp)
+            if dx:
+                distance = self.nearest_crossing(self.vertical_x, self.vertical_lo,
+                                                 self.vertical_hi, x, y, dx)
             else:
-                invalid_points.add(rp)
-                valid = False
-
-        if valid:
-            print(f"Found valid rectangle with area {rect.area} using corners {rect.p1} and {rect.p2}")
-            return rect.area
+                distance = self.nearest_crossing(self.horizontal_y, self.horizontal_lo,
+                                                 self.horizontal_hi, y, x, dy)
+            result.append(limit if distance is None else min(distance, limit))
+        return tuple(result)
+
+    def is_rectangle_inside(self, rect):
+        """Check if the whole rectangle lies inside or on the polygon."""
+        x1, y1 = rect.p1
+        x2, y2 = rect.p2
+        min_x, max_x = min(x1, x2), max(x1, x2)
+        min_y, max_y = min(y1, y2), max(y1, y2)
+
+        if self.crosses_interior(min_x, min_y, max_x, max_y):
+            return False
+
+        if min_x < max_x and min_y < max_y:
+            # The open interior is crossed by no edge, so it is entirely inside
+            # or entirely outside - its centre decides
+            return self.doubled.is_inside(min_x + max_x, min_y + max_y)
+
+        # Degenerate rectangle (a line): test the midpoint of every piece
+        # between polygon vertices lying on it, plus the end points
+        if min_x == max_x:
+            stops = [min_y] + self.segment_breakpoints(min_x, min_y, max_y, True) + [max_y]
+            samples = [(2 * min_x, a + b) for a, b in zip(stops, stops[1:])]
+        else:
+            stops = [min_x] + self.segment_breakpoints(min_y, min_x, max_x, False) + [max_x]
+            samples = [(a + b, 2 * min_y) for a, b in zip(stops, stops[1:])]
+        samples.append((2 * min_x, 2 * min_y))
+        samples.append((2 * max_x, 2 * max_y))
+
+        return all(self.doubled.is_inside(px2, py2) for px2, py2 in samples)
 
-    return -1
-
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-if sys.stdin.isatty():
-    input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
-else:
-    input_file = sys.stdin
-
-points = parse_input(input_file)
+def part2(points):
+    """Part 2 solution with best-first search and edge-crossing rectangle tests."""
 
-print(f"Part 1: {part1(points)}")
-print(f"Part 2: {part2(points)}")
+    # Build polygon from points
+    with phase("edge index"):
+        polygon_edges = build_polygon(points)
+        edge_index = EdgeIndex(polygon_edges)
+
+    if edge_index.has_narrow_gaps():
+        # One-unit gaps hold no lattice point, but the continuous reach and
+        # crossing tests stop at them, so work on the tiles exactly
+        log.info("Polygon has one-unit gaps; using scanline bands instead of edge crossings")
+        with phase("scanline bands"):
+            bands = precompute_valid_points_scanline(points, polygon_edges)
+        with phase("reach"):
+            reach = interval_reach(points, bands)
+        is_valid = partial(is_rectangle_valid, bands=bands)
+    else:
+        # Per-vertex reach bounds prune pairs that would leave the polygon
+        with phase("reach"):
+            bounds = (min(x for x, _ in points), min(y for _, y in points),
+                      max(x for x, _ in points), max(y for _, y in points))
+            reach = [edge_index.reach(x, y, bounds) for x, y in points]
+        is_valid = edge_index.is_rectangle_inside
+
+    with phase("rectangle search"):
+        rect = find_largest_rectangle(points, reach, is_valid)
+    if rect is None:
+        return -1
+
+    log.info("Found valid rectangle with area %d using corners %s and %s", rect.area, rect.p1, rect.p2)
+    return rect.area
+
+def parse(data):
+    return parse_input(data)
+
+def solve(text):
+    points = parse(text)
+    return part1(points), part2(points)
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided
+    data = load_default(script_dir)
+
+    with phase("parse"):
+        points = parse_input(data)
+
+    with phase("part 1"):
+        res1 = part1(points)
+    answer(1, res1)
+    with phase("part 2"):
+        res2 = part2(points)
+    answer(2, res2)
+
+
+if __name__ == "__main__":
+    run_script(main)
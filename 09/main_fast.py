@@ -1,37 +1,27 @@
 #!/usr/bin/env python3
 
+import logging
 import sys
 import os
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 
-class Rectangle:
-    def __init__(self, p1, p2):
-        self.p1 = p1  # (x1, y1)
-        self.p2 = p2  # (x2, y2)
-
-    @property
-    def area(self):
-        width = abs(self.p2[0] - self.p1[0]) + 1
-        height = abs(self.p2[1] - self.p1[1]) + 1
-        return width * height
-
-    def get_rectangle_points(self):
-        x1, y1 = self.p1
-        x2, y2 = self.p2
-        points = []
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            for y in range(min(y1, y2), max(y1, y2) + 1):
-                points.append((x, y))
-        return points
-
-def parse_input(input_file):
-    """Parse input file into list of 2D coordinates."""
-    points = []
-    for line in input_file:
-        line = line.strip()
-        if line:
-            x, y = map(int, line.split(','))
-            points.append((x, y))
-    return points
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.inputs import int_tuples, load_default
+from aoc25.log import answer, get_logger
+from polygon_index import PolygonIndex
+from rectangle_search import find_largest_rectangle, iter_rectangles
+from shared_bands import find_largest_parallel
+
+log = get_logger("day09")
+
+def parse_input(data):
+    """Parse the input buffer into a list of 2D coordinates."""
+    return int_tuples(data, 2, signed=True)
 
 def part1(points):
     """Find the largest rectangle using given points as opposite corners."""
@@ -53,9 +43,9 @@ def part1(points):
                 max_area = area
                 best_corners = (points[i], points[j])
 
-    print(f"Largest rectangle area: {max_area}")
+    log.info("Largest rectangle area: %d", max_area)
     if best_corners:
-        print(f"Opposite corners: {best_corners[0]} and {best_corners[1]}")
+        log.info("Opposite corners: %s and %s", best_corners[0], best_corners[1])
 
     return max_area
 
@@ -67,59 +57,105 @@ def build_polygon(points):
         edges.append((p1, p2))
     return edges
 
-def is_point_on_edge(point, edges):
-    for edge in edges:
-        if is_point_on_line_segment(point, edge):
-            return True
-    return False
-
-def is_point_on_line_segment(point, line_segment):
-    (x1, y1), (x2, y2) = line_segment
-    (px, py) = point
-
-    # Check if point is within bounding box of edge
-    if min(x1, x2) <= px <= max(x1, x2) and min(y1, y2) <= py <= max(y1, y2):
-        # Check collinearity using cross product
-        return (y2 - y1) * (px - x1) == (x2 - x1) * (py - y1)
-    return False
-
-def is_point_inside_polygon(point, polygon_edges):
-    if is_point_on_edge(point, polygon_edges):
-        return True  # On edge is considered inside
-
-    # Ray-casting algorithm to check if point is inside polygon
-    x_intersections = 0
-    for edge in polygon_edges:
-        if does_ray_intersect_segment(point, edge):
-            x_intersections += 1
-
-    return x_intersections % 2 == 1  # Inside if odd number of intersections
-
-def does_ray_intersect_segment(point, line_segment):
-    (x1, y1), (x2, y2) = line_segment
-    (px, py) = point
-
-    if y1 > y2:
-        x1, y1, x2, y2 = x2, y2, x1, y1
-
-    if py == y1 or py == y2:
-        py += 0.1  # Slightly adjust point to avoid ambiguity
-
-    if py < y1 or py > y2:
-        return False
-
-    if x1 == x2:  # Vertical line
-        return px <= x1
-
-    # Calculate intersection point
-    slope = (y2 - y1) / (x2 - x1)
-    x_intersect = x1 + (py - y1) / slope
-
-    return px <= x_intersect
+class IntervalBands:
+    """Run-length store of the valid x-intervals of every scanline.
+
+    The interval set only changes at vertex y-coordinates, so consecutive
+    scanlines with identical intervals share one band. Band k covers
+    band_starts[k] <= y < band_starts[k + 1] (the last band ends at end_y)
+    and owns interval_starts/interval_ends[offsets[k]:offsets[k + 1]],
+    sorted and non-overlapping.
+    """
+    def __init__(self, end_y):
+        self.end_y = end_y
+        self.band_starts = []
+        self.offsets = [0]
+        self.interval_starts = []
+        self.interval_ends = []
+
+    @classmethod
+    def from_arrays(cls, end_y, band_starts, offsets, interval_starts, interval_ends):
+        """Bands over existing arrays (lists or memoryviews), without copying."""
+        bands = cls(end_y)
+        bands.band_starts = band_starts
+        bands.offsets = offsets
+        bands.interval_starts = interval_starts
+        bands.interval_ends = interval_ends
+        return bands
+
+    def append_band(self, start_y, intervals):
+        self.band_starts.append(start_y)
+        for x_start, x_end in intervals:
+            self.interval_starts.append(x_start)
+            self.interval_ends.append(x_end)
+        self.offsets.append(len(self.interval_starts))
+
+    def band_end(self, band):
+        """Last y-coordinate covered by a band."""
+        if band + 1 < len(self.band_starts):
+            return self.band_starts[band + 1] - 1
+        return self.end_y
+
+    def find_band(self, y):
+        """Index of the band containing y, or -1 outside the polygon's y-range."""
+        if y > self.end_y:
+            return -1
+        return bisect_right(self.band_starts, y) - 1
+
+    def covering_interval(self, band, x):
+        """Index of the band's interval containing x, or -1."""
+        lo, hi = self.offsets[band], self.offsets[band + 1]
+        i = bisect_right(self.interval_starts, x, lo, hi) - 1
+        if i >= lo and x <= self.interval_ends[i]:
+            return i
+        return -1
+
+    def contains(self, x, y):
+        band = self.find_band(y)
+        return band >= 0 and self.covering_interval(band, x) >= 0
+
+    def total_points(self):
+        total = 0
+        for band in range(len(self.band_starts)):
+            height = self.band_end(band) - self.band_starts[band] + 1
+            for i in range(self.offsets[band], self.offsets[band + 1]):
+                total += height * (self.interval_ends[i] - self.interval_starts[i] + 1)
+        return total
+
+
+def merge_intervals(intervals):
+    """Sort and merge overlapping or adjacent intervals."""
+    if not intervals:
+        return []
+    intervals.sort()
+    merged = [intervals[0]]
+    for x_start, x_end in intervals[1:]:
+        if x_start <= merged[-1][1] + 1:
+            # Overlapping or adjacent - merge
+            merged[-1] = (merged[-1][0], max(merged[-1][1], x_end))
+        else:
+            merged.append((x_start, x_end))
+    return merged
+
+def scanline_intervals(active_x, horizontal_ranges):
+    """Valid intervals of one scanline from the sorted crossing x-coordinates."""
+    intervals = list(horizontal_ranges)
+
+    # Add interior ranges between vertical edge transitions
+    # Use pairs of active_x to determine inside/outside
+    for i in range(0, len(active_x) - 1, 2):
+        intervals.append((active_x[i], active_x[i + 1]))
+
+    return merge_intervals(intervals)
 
 def precompute_valid_points_scanline(points, polygon_edges):
-    """Pre-compute all points using scanline algorithm (optimized for rectilinear polygons)."""
-    print("Pre-computing valid points using scanline algorithm...")
+    """Pre-compute valid intervals per band of scanlines (optimized for rectilinear polygons).
+
+    Sweeps the vertex y-coordinates once, keeping the x of the vertical
+    edges active on the current scanline sorted. Each vertex row gets its
+    own band (horizontal edges lie on it) and the rows up to the next
+    vertex share a second one.
+    """
 
     # Find bounding box
     min_x = min(p[0] for p in points)
@@ -127,154 +163,187 @@ def precompute_valid_points_scanline(points, polygon_edges):
     min_y = min(p[1] for p in points)
     max_y = max(p[1] for p in points)
 
-    print(f"Polygon bounding box: ({min_x}, {min_y}) to ({max_x}, {max_y})")
-    print(f"Scanlines to process: {max_y - min_y + 1}")
+    log.info("Polygon bounding box: (%d, %d) to (%d, %d)", min_x, min_y, max_x, max_y)
 
-    # Pre-build edge lookup by y-coordinate for MASSIVE speedup
-    # Map: y -> list of edges that intersect this y-coordinate
-    from collections import defaultdict
     horizontal_edges_by_y = defaultdict(list)  # y -> [(x_start, x_end), ...]
-    vertical_edges_by_y = defaultdict(list)    # y -> [x, x, x, ...]
+    edges_starting = defaultdict(list)         # y -> [x, ...] of vertical edges with y_min == y
+    edges_ending = defaultdict(list)           # y -> [x, ...] of vertical edges with y_max == y
 
-    print("Building edge lookup maps...")
     for (x1, y1), (x2, y2) in polygon_edges:
         if y1 == y2:
-            # Horizontal edge
             horizontal_edges_by_y[y1].append((min(x1, x2), max(x1, x2)))
         elif x1 == x2:
-            # Vertical edge - add to all y-coordinates it spans
-            y_min, y_max = min(y1, y2), max(y1, y2)
-            for y in range(y_min, y_max + 1):
-                # Only add as transition point if not at top endpoint
-                if y == y_min or y_min < y < y_max:
-                    vertical_edges_by_y[y].append(x1)
-
-    print("Edge maps built. Processing scanlines...")
-    # Store intervals instead of individual points!
-    valid_intervals = {}  # y -> [(x_start, x_end), ...]
-
-    # Process each scanline (horizontal line at y-coordinate)
-    for y in range(min_y, max_y + 1):
-        if (y - min_y) % 1000 == 0:
-            print(f"Processing scanline {y - min_y}/{max_y - min_y + 1}...")
-
-        # Get pre-filtered edges for this scanline (O(1) lookup!)
-        horizontal_ranges = horizontal_edges_by_y.get(y, [])
-        vertical_x = sorted(vertical_edges_by_y.get(y, []))
-
-        intervals = []
-
-        # Add horizontal ranges (these are ON the polygon boundary)
-        intervals.extend(horizontal_ranges)
-
-        # Add interior ranges between vertical edge transitions
-        # Use pairs of vertical_x to determine inside/outside
-        i = 0
-        while i < len(vertical_x) - 1:
-            x_start = vertical_x[i]
-            x_end = vertical_x[i + 1]
-            intervals.append((x_start, x_end))
-            i += 2  # Move to next pair (outside -> inside -> outside)
-
-        # Merge overlapping intervals for efficiency
-        if intervals:
-            intervals.sort()
-            merged = [intervals[0]]
-            for x_start, x_end in intervals[1:]:
-                if x_start <= merged[-1][1] + 1:
-                    # Overlapping or adjacent - merge
-                    merged[-1] = (merged[-1][0], max(merged[-1][1], x_end))
-                else:
-                    merged.append((x_start, x_end))
-            valid_intervals[y] = merged
-
-    total_points = sum((x_end - x_start + 1) for intervals in valid_intervals.values()
-                      for x_start, x_end in intervals)
-    print(f"Scanline pre-computation complete! {len(valid_intervals)} y-coordinates with intervals")
-    print(f"Total valid points: {total_points}")
-    return valid_intervals
-
-def build_rectangles(points):
-    rectangles = []
+            # A vertical edge is a transition on rows y_min <= y < y_max
+            edges_starting[min(y1, y2)].append(x1)
+            edges_ending[max(y1, y2)].append(x1)
+
+    event_ys = sorted(set(edges_starting) | set(edges_ending) | set(horizontal_edges_by_y))
+    log.info("Scanline events to process: %d", len(event_ys))
+
+    bands = IntervalBands(max_y)
+    active_x = []
+    for k, y in enumerate(event_ys):
+        for x in edges_ending.get(y, []):
+            active_x.remove(x)
+        for x in edges_starting.get(y, []):
+            insort(active_x, x)
+
+        # Row y itself, then the rows strictly between this event and the next
+        bands.append_band(y, scanline_intervals(active_x, horizontal_edges_by_y.get(y, [])))
+        if k + 1 < len(event_ys) and event_ys[k + 1] > y + 1:
+            bands.append_band(y + 1, scanline_intervals(active_x, []))
+
+    log.info("Scanline pre-computation complete! %d bands with %d intervals",
+             len(bands.band_starts), len(bands.interval_starts))
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Total valid points: %d", bands.total_points())
+    return bands
+
+def column_rows(points, xs):
+    """For each x in sorted `xs`, the sorted y of every horizontal edge over that column."""
+    rows = {x: [] for x in xs}
     for i in range(len(points)):
-        for j in range(i + 1, len(points)):
-            rect = Rectangle(points[i], points[j])
-            rectangles.append(rect)
-    # Sort by area descending (largest first)
-    rectangles.sort(key=lambda r: r.area, reverse=True)
-    return rectangles
-
-def is_point_in_intervals(x, y, valid_intervals):
+        (x1, y1), (x2, y2) = points[i], points[(i + 1) % len(points)]
+        if y1 == y2:
+            for k in range(bisect_left(xs, min(x1, x2)), bisect_right(xs, max(x1, x2))):
+                rows[xs[k]].append(y1)
+    for ys in rows.values():
+        ys.sort()
+    return rows
+
+def column_extent(bands, x, y, ys, step):
+    """Furthest y reached from covered (x, y) along the column in direction `step`.
+
+    Coverage of a column only changes at horizontal edges over it, and the
+    edge rows themselves are on the boundary. So hop from edge row to edge
+    row while the rows between them (if any) are covered; one probe per gap.
+    """
+    if step > 0:
+        k = bisect_right(ys, y)
+        while k < len(ys) and (ys[k] == y + 1 or bands.contains(x, y + 1)):
+            y = ys[k]
+            k = bisect_right(ys, y)
+    else:
+        k = bisect_left(ys, y) - 1
+        while k >= 0 and (ys[k] == y - 1 or bands.contains(x, y - 1)):
+            y = ys[k]
+            k = bisect_left(ys, y) - 1
+    return y
+
+def interval_reach(points, bands):
+    """Per-vertex reach bounds (left, right, down, up) for the rectangle search.
+
+    Left/right come from the vertex's own scanline interval; up/down hop
+    along the horizontal edges over the vertex's column (see column_extent).
+    """
+    rows = column_rows(points, sorted({x for x, _ in points}))
+    reach = []
+    for x, y in points:
+        band = bands.find_band(y)
+        i = bands.covering_interval(band, x) if band >= 0 else -1
+        if i < 0:
+            reach.append((0, 0, 0, 0))
+            continue
+        left = x - bands.interval_starts[i]
+        right = bands.interval_ends[i] - x
+        down = y - column_extent(bands, x, y, rows[x], -1)
+        up = column_extent(bands, x, y, rows[x], 1) - y
+        reach.append((left, right, down, up))
+    return reach
+
+def is_point_in_intervals(x, y, bands):
     """Check if point (x,y) is in any valid interval for that y-coordinate."""
-    intervals = valid_intervals.get(y)
-    if not intervals:
-        return False
-    # Binary search would be faster, but linear is fine for small interval counts
-    for x_start, x_end in intervals:
-        if x_start <= x <= x_end:
-            return True
-    return False
-
-def is_rectangle_valid(rect, valid_intervals):
-    """Check if entire rectangle falls within valid intervals (FAST!)."""
+    return bands.contains(x, y)
+
+def is_rectangle_valid(rect, bands):
+    """Check if entire rectangle falls within valid intervals, one band at a time."""
     x1, y1 = rect.p1
     x2, y2 = rect.p2
     min_x, max_x = min(x1, x2), max(x1, x2)
     min_y, max_y = min(y1, y2), max(y1, y2)
 
-    # Check each y-coordinate of the rectangle
-    for y in range(min_y, max_y + 1):
-        intervals = valid_intervals.get(y)
-        if not intervals:
-            return False  # This y-row has no valid intervals
-
-        # Check if the rectangle's x-range [min_x, max_x] is fully covered
-        # The rectangle is valid if its full x-range falls within valid intervals
-        covered = False
-        for x_start, x_end in intervals:
-            if x_start <= min_x and max_x <= x_end:
-                # Entire rectangle width is covered by this interval
-                covered = True
-                break
+    first = bands.find_band(min_y)
+    last = bands.find_band(max_y)
+    if first < 0 or last < 0:
+        return False  # Rectangle leaves the polygon's y-range
 
-        if not covered:
-            return False  # This row isn't fully covered
+    # Every band the rectangle overlaps must have one interval covering
+    # the rectangle's full x-range [min_x, max_x]
+    for band in range(first, last + 1):
+        i = bands.covering_interval(band, min_x)
+        if i < 0 or bands.interval_ends[i] < max_x:
+            return False
 
     return True
 
-def part2(points):
-    """Part 2 solution with interval-based validation (MUCH FASTER!)."""
+def part2(points, workers=0):
+    """Part 2 solution with interval-based validation (MUCH FASTER!).
+
+    With workers > 0 the band checks run in that many processes, reading
+    the bands from shared memory.
+    """
 
     # Build polygon from points
     polygon_edges = build_polygon(points)
 
-    # Pre-compute valid intervals (ONE TIME COST)
-    valid_intervals = precompute_valid_points_scanline(points, polygon_edges)
-
-    # Build rectangles sorted by area
-    rectangles = build_rectangles(points)
-    print(f"\nTotal rectangles to check: {len(rectangles)}")
-
-    # Check rectangles (SUPER FAST with interval checking)
-    for i, rect in enumerate(rectangles):
-        if i % 1000 == 0 and i > 0:
-            print(f"Checked {i}/{len(rectangles)} rectangles...")
-
-        if is_rectangle_valid(rect, valid_intervals):
-            print(f"\nFound valid rectangle with area {rect.area} using corners {rect.p1} and {rect.p2}")
-            return rect.area
-
-    return -1
-
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-if sys.stdin.isatty():
-    input_file = open(os.path.join(script_dir, 'example.txt'), 'r')
-else:
-    input_file = sys.stdin
-
-points = parse_input(input_file)
-
-print(f"Part 1: {part1(points)}")
-print(f"\n{'='*60}")
-print(f"Part 2: {part2(points)}")
+    # Pre-compute valid interval bands (ONE TIME COST)
+    with phase("scanline bands"):
+        bands = precompute_valid_points_scanline(points, polygon_edges)
+    with phase("polygon index"):
+        polygon_index = PolygonIndex(points)
+
+    def is_valid(rect):
+        # Cheap O(log n) rejection: the rectangle's centre must be inside
+        (x1, y1), (x2, y2) = rect.p1, rect.p2
+        if not polygon_index.is_inside((x1 + x2) // 2, (y1 + y2) // 2):
+            return False
+        return is_rectangle_valid(rect, bands)
+
+    # Candidates come lazily, largest area first, pruned by per-vertex reach
+    with phase("reach"):
+        reach = interval_reach(points, bands)
+    with phase("rectangle search"):
+        if workers:
+            # The centre test stays here; workers only do the band checks
+            inside = (rect for rect in iter_rectangles(points, reach)
+                      if polygon_index.is_inside((rect.p1[0] + rect.p2[0]) // 2,
+                                                 (rect.p1[1] + rect.p2[1]) // 2))
+            rect = find_largest_parallel(inside, bands, is_rectangle_valid, workers)
+        else:
+            rect = find_largest_rectangle(points, reach, is_valid)
+    if rect is None:
+        return -1
+
+    log.info("Found valid rectangle with area %d using corners %s and %s", rect.area, rect.p1, rect.p2)
+    return rect.area
+
+def parse(data):
+    return parse_input(data)
+
+def solve(text):
+    points = parse(text)
+    return part1(points), part2(points)
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, default=0, metavar='N',
+                        help="check part 2 rectangles in N processes over shared memory (default: 0, serial)")
+
+def main(args):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Use example.txt as default if no stdin provided
+    data = load_default(script_dir)
+
+    with phase("parse"):
+        points = parse_input(data)
+
+    with phase("part 1"):
+        res1 = part1(points)
+    answer(1, res1)
+    with phase("part 2"):
+        res2 = part2(points, args.workers)
+    answer(2, res2)
+
+
+if __name__ == "__main__":
+    run_script(main, arguments=add_arguments)
@@ -0,0 +1,155 @@
+"""Exact point-in-polygon queries for rectilinear polygons."""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+
+class PolygonIndex:
+    """Slab decomposition of a rectilinear polygon.
+
+    The distinct vertex y-coordinates cut the plane into horizontal slabs.
+    Each slab stores the sorted x of every vertical edge spanning it, so a
+    ray cast towards +x becomes one bisect. Edges are also grouped by their
+    fixed coordinate for on-edge tests. All arithmetic is on integers.
+    """
+    def __init__(self, points):
+        n = len(points)
+        horizontal = defaultdict(list)  # y -> [(x_min, x_max), ...]
+        vertical = defaultdict(list)    # x -> [(y_min, y_max), ...]
+        for i in range(n):
+            (x1, y1), (x2, y2) = points[i], points[(i + 1) % n]
+            if y1 == y2:
+                horizontal[y1].append((min(x1, x2), max(x1, x2)))
+            elif x1 == x2:
+                vertical[x1].append((min(y1, y2), max(y1, y2)))
+            else:
+                raise ValueError(f"Edge {(x1, y1)} -> {(x2, y2)} is not axis-aligned")
+
+        self.horizontal = {y: self._split_spans(spans) for y, spans in horizontal.items()}
+        self.vertical = {x: self._split_spans(spans) for x, spans in vertical.items()}
+
+        # Slab k covers ys[k] <= y < ys[k + 1]
+        self.ys = sorted({y for _, y in points})
+        self.slab_xs = [[] for _ in range(max(len(self.ys) - 1, 0))]
+        for x, spans in vertical.items():
+            for y_min, y_max in spans:
+                for k in range(bisect_left(self.ys, y_min), bisect_left(self.ys, y_max)):
+                    self.slab_xs[k].append(x)
+        for xs in self.slab_xs:
+            xs.sort()
+
+        self._arrays = None
+
+    @staticmethod
+    def _split_spans(spans):
+        spans.sort()
+        return [lo for lo, _ in spans], [hi for _, hi in spans]
+
+    @staticmethod
+    def _in_spans(spans, value):
+        if spans is None:
+            return False
+        los, his = spans
+        i = bisect_right(los, value) - 1
+        return i >= 0 and value <= his[i]
+
+    def is_on_edge(self, x, y):
+        """Check if (x, y) lies on the polygon boundary."""
+        return (self._in_spans(self.horizontal.get(y), x)
+                or self._in_spans(self.vertical.get(x), y))
+
+    def is_inside(self, x, y):
+        """Check if (x, y) is inside the polygon, boundary included."""
+        if self.is_on_edge(x, y):
+            return True
+
+        k = bisect_right(self.ys, y) - 1
+        if k < 0 or k >= len(self.slab_xs):
+            return False
+
+        xs = self.slab_xs[k]
+        crossings = len(xs) - bisect_right(xs, x)
+        return crossings % 2 == 1
+
+    def _build_arrays(self):
+        """Flatten the index into sorted NumPy key arrays for batch queries."""
+        import numpy as np
+
+        # Slabs: key = slab * stride + rank(x), rank over all vertical-edge x
+        edge_xs = np.array(sorted(self.vertical), dtype=np.int64)
+        stride = len(edge_xs) + 1
+        slab_keys = []
+        slab_ends = []
+        for k, xs in enumerate(self.slab_xs):
+            slab_keys.extend(k * stride + int(r) for r in np.searchsorted(edge_xs, xs))
+            slab_ends.append(len(slab_keys))
+
+        self._arrays = {
+            'ys': np.array(self.ys, dtype=np.int64),
+            'edge_xs': edge_xs,
+            'stride': stride,
+            'slab_keys': np.array(slab_keys, dtype=np.int64),
+            'slab_ends': np.array(slab_ends, dtype=np.int64),
+            'horizontal': self._flatten_spans(np, self.horizontal),
+            'vertical': self._flatten_spans(np, self.vertical),
+        }
+        return self._arrays
+
+    @staticmethod
+    def _flatten_spans(np, spans_by_coord):
+        """Concatenate spans ordered by (fixed coordinate, span start)."""
+        coords = sorted(spans_by_coord)
+        ranks, los, his = [], [], []
+        for rank, coord in enumerate(coords):
+            starts, ends = spans_by_coord[coord]
+            ranks.extend([rank] * len(starts))
+            los.extend(starts)
+            his.extend(ends)
+        ranks = np.array(ranks, dtype=np.int64)
+        los = np.array(los, dtype=np.int64)
+        his = np.array(his, dtype=np.int64)
+        base = int(los.min()) if len(los) else 0
+        width = int(his.max()) - base + 1 if len(his) else 1
+        # key = rank(fixed) * width + (start - base), sorted by construction
+        keys = ranks * width + (los - base)
+        return np.array(coords, dtype=np.int64), keys, los, his, base, width
+
+    @staticmethod
+    def _in_spans_many(np, spans, fixed_values, values):
+        coords, keys, los, his, base, width = spans
+        if len(coords) == 0:
+            return np.zeros(len(values), dtype=bool)
+
+        rank = np.minimum(np.searchsorted(coords, fixed_values), len(coords) - 1)
+        offset = np.clip(values - base, 0, width - 1)
+        j = np.searchsorted(keys, rank * width + offset, side='right') - 1
+        j_safe = np.maximum(j, 0)
+        return ((coords[rank] == fixed_values)
+                & (j >= 0)
+                & (keys[j_safe] // width == rank)
+                & (los[j_safe] <= values)
+                & (values <= his[j_safe]))
+
+    def is_inside_many(self, xs, ys):
+        """Vectorized `is_inside` over NumPy arrays of x and y coordinates."""
+        import numpy as np
+
+        arrays = self._arrays or self._build_arrays()
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+
+        on_edge = (self._in_spans_many(np, arrays['horizontal'], ys, xs)
+                   | self._in_spans_many(np, arrays['vertical'], xs, ys))
+
+        k = np.searchsorted(arrays['ys'], ys, side='right') - 1
+        in_range = (k >= 0) & (k < len(arrays['slab_ends']))
+        k = np.clip(k, 0, max(len(arrays['slab_ends']) - 1, 0))
+
+        inside = np.zeros(len(xs), dtype=bool)
+        if len(arrays['slab_ends']):
+            slab_ends = arrays['slab_ends'][k]
+            query = k * arrays['stride'] + np.searchsorted(arrays['edge_xs'], xs, side='right')
+            crossings = slab_ends - np.searchsorted(arrays['slab_keys'], query, side='left')
+            inside = in_range & (crossings % 2 == 1)
+
+        return on_edge | inside
@@ -0,0 +1,94 @@
+"""Best-first search over corner pairs, largest area first."""
+
+import heapq
+
+from aoc25.log import Progress, get_logger
+
+log = get_logger("day09")
+
+
+class Rectangle:
+    __slots__ = ('p1', 'p2', 'area')
+
+    def __init__(self, p1, p2):
+        self.p1 = p1  # (x1, y1)
+        self.p2 = p2  # (x2, y2)
+        self.area = (abs(p2[0] - p1[0]) + 1) * (abs(p2[1] - p1[1]) + 1)
+
+
+def fits_reach(points, reach, i, j):
+    """Check if corners i and j are close enough given each corner's reach.
+
+    reach[k] = (left, right, down, up) is how far the polygon interior
+    extends from point k along its row and column. Both rectangle edges
+    through a corner must stay within that corner's reach.
+    """
+    (x1, y1), (x2, y2) = points[i], points[j]
+    left1, right1, down1, up1 = reach[i]
+    left2, right2, down2, up2 = reach[j]
+    dx = x2 - x1
+    dy = y2 - y1
+    if dx >= 0:
+        if dx > right1 or dx > left2:
+            return False
+    elif -dx > left1 or -dx > right2:
+        return False
+    if dy >= 0:
+        if dy > up1 or dy > down2:
+            return False
+    elif -dy > down1 or -dy > up2:
+        return False
+    return True
+
+
+def pair_area(points, i, j):
+    (x1, y1), (x2, y2) = points[i], points[j]
+    return (abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
+
+
+def iter_rectangles(points, reach):
+    """Yield rectangles that fit the reach bounds, by area descending.
+
+    The heap holds one entry per corner: first the corner's best possible
+    area, and once that reaches the top, the corner's partners sorted by
+    area are consumed one at a time. Only corners whose bound reaches the
+    top of the heap ever materialize their partner list.
+    """
+    n = len(points)
+    heap = []
+    for i in range(n):
+        best = 0
+        for j in range(i + 1, n):
+            if fits_reach(points, reach, i, j):
+                best = max(best, pair_area(points, i, j))
+        if best:
+            heap.append((-best, i, -1, None))
+    heapq.heapify(heap)
+
+    while heap:
+        neg_area, i, pos, partners = heapq.heappop(heap)
+        if partners is None:
+            # Expand corner i into its partners, largest area first
+            partners = [(pair_area(points, i, j), j) for j in range(i + 1, n)
+                        if fits_reach(points, reach, i, j)]
+            partners.sort(reverse=True)
+            heapq.heappush(heap, (-partners[0][0], i, 0, partners))
+            continue
+
+        yield Rectangle(points[i], points[partners[pos][1]])
+        if pos + 1 < len(partners):
+            heapq.heappush(heap, (-partners[pos + 1][0], i, pos + 1, partners))
+
+
+def find_largest_rectangle(points, reach, is_valid):
+    """Return the largest valid rectangle, or None if there is none.
+
+    Candidates come out in non-increasing area order, so the first valid
+    one is the answer and everything left in the heap is pruned.
+    """
+    progress = Progress(log, "Checked %d rectangles (current area %d)...")
+    for checked, rect in enumerate(iter_rectangles(points, reach)):
+        progress.update(checked, rect.area)
+        if is_valid(rect):
+            return rect
+    return None
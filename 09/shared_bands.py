@@ -0,0 +1,125 @@
+"""Rectangle validation in worker processes over interval bands in shared memory."""
+
+import os
+
+from array import array
+from collections import deque
+from itertools import islice
+from multiprocessing import Value
+from multiprocessing.shared_memory import SharedMemory
+
+from aoc25.log import Progress, get_logger
+from aoc25.pool import process_pool
+
+log = get_logger("day09")
+
+CHUNK_RECTANGLES = 256  # Candidates handed to a worker at a time
+HEADER = 3  # band count, interval count, end_y
+
+
+def pack_bands(bands) -> SharedMemory:
+    """Copy an IntervalBands into one new shared block as flat int64 arrays.
+
+    Layout: the header, then band_starts, offsets, interval_starts and
+    interval_ends back to back. The caller closes and unlinks the block.
+    """
+    header = (len(bands.band_starts), len(bands.interval_starts), bands.end_y)
+    data = array('q', header)
+    for values in (bands.band_starts, bands.offsets, bands.interval_starts, bands.interval_ends):
+        data.extend(values)
+    block = SharedMemory(create=True, size=len(data) * data.itemsize)
+    block.buf[:len(data) * data.itemsize] = data.tobytes()
+    return block
+
+
+def attach_bands(block: SharedMemory, bands_class):
+    """An IntervalBands reading straight from a packed block, without copying."""
+    view = block.buf.cast('q')
+    band_count, interval_count, end_y = view[0], view[1], view[2]
+    at = HEADER
+    arrays = []
+    for length in (band_count, band_count + 1, interval_count, interval_count):
+        arrays.append(view[at:at + length])
+        at += length
+    return bands_class.from_arrays(end_y, *arrays)
+
+
+# Per-worker state, set once by _init_worker
+_block = None
+_bands = None
+_validate = None
+_bound = None
+
+
+def _init_worker(name: str, bands_class, validate, bound):
+    global _block, _bands, _validate, _bound
+    _block = SharedMemory(name=name)
+    _bands = attach_bands(_block, bands_class)
+    _validate = validate
+    _bound = bound
+
+
+def _check_chunk(rects) -> int:
+    """Index of the first valid rectangle in an area-sorted chunk, or -1.
+
+    A valid rectangle raises the shared bound, and every worker gives up on
+    its chunk as soon as it reaches areas below the bound.
+    """
+    for k, rect in enumerate(rects):
+        if rect.area < _bound.value:
+            return -1
+        if _validate(rect, _bands):
+            with _bound.get_lock():
+                _bound.value = max(_bound.value, rect.area)
+            return k
+    return -1
+
+
+def find_largest_parallel(rectangles, bands, validate, workers: int | None = None,
+                          chunk_size: int = CHUNK_RECTANGLES):
+    """The first rectangle `validate(rect, bands)` accepts, checked in parallel.
+
+    `rectangles` must come largest area first, as from iter_rectangles, and
+    the result is the one a serial scan would return. Chunks are submitted
+    in order, at most two per worker in flight, and their results read back
+    in the same order, so the first valid one read is the answer. Nothing
+    more is submitted once the next candidate is smaller than a rectangle
+    some worker already found.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    rectangles = iter(rectangles)
+    bound = Value('q', 0)
+    block = pack_bands(bands)
+    progress = Progress(log, "Checked %d chunks of rectangles...")
+    try:
+        # validate's module is loaded in each worker first, so spawned and
+        # forkserver workers can unpickle it and the bands class
+        with process_pool(validate, workers, initializer=_init_worker,
+                          initargs=(block.name, type(bands), validate, bound)) as executor:
+            pending = deque()
+            done = 0
+            feeding = True
+            while True:
+                if feeding:
+                    chunk = list(islice(rectangles, chunk_size))
+                    # Stop feeding when candidates run out or are all too small
+                    feeding = bool(chunk) and chunk[0].area >= bound.value
+                    if feeding:
+                        pending.append((chunk, executor.submit(_check_chunk, chunk)))
+                        if len(pending) < 2 * workers:
+                            continue
+                if not pending:
+                    return None
+
+                chunk, future = pending.popleft()
+                found = future.result()
+                done += 1
+                progress.update(done)
+                if found >= 0:
+                    for _, later in pending:
+                        later.cancel()
+                    return chunk[found]
+    finally:
+        block.close()
+        block.unlink()
@@ -3,16 +3,80 @@
 import sys
 import os
 import heapq
-import numpy as np
-import scipy.optimize
+import re
+import time
 
+from array import array
 from collections import deque
+from fractions import Fraction
+from functools import partial
+from itertools import islice
+from math import lcm
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)  # Makes the shared aoc25 package importable
+
+from aoc25.instrument import phase, run_script
+from aoc25.log import Progress, answer, get_logger
+from aoc25.pool import process_pool
+
+from solve_cache import SolveCache, canonical_signature
+
+log = get_logger("day10")
+
+try:
+    import numpy as np
+    import scipy.optimize
+except ImportError:  # SciPy is only needed for the optional MILP engine
+    np = None
+    scipy = None
+
+# Below this many part 2 machines a process pool costs more than it saves
+PARALLEL_MIN_MACHINES = 64
+
+MACHINE_PATTERN = re.compile(r'\[([.#]*)\]([^{\n]*)\{([\d,]*)\}')
+BUTTON_PATTERN = re.compile(r'\(([\d,]*)\)')
+LIGHT_BITS = str.maketrans('.#', '01')
 
 class Machine:
-    def __init__(self):
-        self.lights: list[bool] = []
-        self.buttons: list[list[int]] = []
-        self.joltage: list[int] = []
+    """One machine, stored as bitmasks.
+
+    Bit i of `light_mask` is light i of the target, bit i of a button mask
+    means the button touches index i. `lights` and `buttons` rebuild the
+    list forms on demand.
+    """
+    __slots__ = ('num_lights', 'light_mask', 'button_masks', 'joltage', '_incidence')
+
+    def __init__(self, num_lights: int = 0, light_mask: int = 0,
+                 button_masks: tuple[int, ...] = (), joltage: tuple[int, ...] = ()):
+        self.num_lights = num_lights
+        self.light_mask = light_mask
+        self.button_masks = button_masks
+        self.joltage = joltage
+        self._incidence = None
+
+    @classmethod
+    def from_lists(cls, lights: list[bool], buttons: list[list[int]], joltage: list[int]) -> 'Machine':
+        return cls(len(lights), lights_to_mask(lights),
+                   tuple(button_to_mask(button) for button in buttons), tuple(joltage))
+
+    @property
+    def lights(self) -> list[bool]:
+        return [bool(self.light_mask >> i & 1) for i in range(self.num_lights)]
+
+    @property
+    def buttons(self) -> list[list[int]]:
+        return [[i for i in range(mask.bit_length()) if mask >> i & 1] for mask in self.button_masks]
+
+    @property
+    def incidence(self):
+        """0/1 NumPy matrix A with A[i][j] = 1 if button j affects index i (built once, needs NumPy)."""
+        if self._incidence is None:
+            masks = np.array(self.button_masks, dtype=np.int64).reshape(1, -1)
+            indices = np.arange(len(self.joltage), dtype=np.int64).reshape(-1, 1)
+            self._incidence = (masks >> indices) & 1
+        return self._incidence
 
     def print_machine(self):
         print("Lights:")
@@ -22,56 +86,100 @@ class Machine:
         for i, button in enumerate(self.buttons):
             print(f"  Button {i}: {button}")
         print("Joltage:")
-        print(f"  {self.joltage}")
-
-
-def parse_input(input_data) -> list[Machine]:
-    machines: list[Machine] = []
-    for i, line in enumerate(input_data.strip().splitlines()):
-        machine = Machine()
-        for element in line.split(' '):
-            if element[0] == '[' and element[-1] == ']':
-                for char in element[1:-1]:
-                    machine.lights.append(char == '#')
-            elif element[0] == '(' and element[-1] == ')':
-                button_values = list(map(int, element[1:-1].split(',')))
-                machine.buttons.append(button_values)
-            elif element[0] == '{' and element[-1] == '}':
-                machine.joltage = list(map(int, element[1:-1].split(',')))
-        machines.append(machine)
-    return machines
+        print(f"  {list(self.joltage)}")
 
-def calculate_light_score(lights: list[bool], machine: Machine) -> int:
-    score = 0
-    for i, light in enumerate(machine.lights):
-        if lights[i] == light:
-            score += 1
-    return score
 
-def apply_button_lights(lights: list[bool], button: list[int]) -> list[bool]:
-    """Apply a button press to the lights state."""
-    new_lights = lights.copy()
-    for index in button:
-        new_lights[index] = not new_lights[index]
-    return new_lights
+class MachineBatch:
+    """Columnar storage for many machines.
+
+    Button masks and joltage targets of all machines live in two flat
+    arrays; machine i owns button_masks[button_offsets[i]:button_offsets[i + 1]]
+    and joltage[joltage_offsets[i]:joltage_offsets[i + 1]]. Indexing builds
+    a fresh Machine from those slices and keeps nothing, so the arrays stay
+    the only per-machine storage.
+    """
+    def __init__(self):
+        self.num_lights = array('H')
+        self.light_masks = array('Q')
+        self.button_offsets = array('Q', [0])
+        self.button_masks = array('Q')
+        self.joltage_offsets = array('Q', [0])
+        self.joltage = array('q')
+
+    def append(self, num_lights: int, light_mask: int, button_masks, joltage):
+        self.num_lights.append(num_lights)
+        self.light_masks.append(light_mask)
+        self.button_masks.extend(button_masks)
+        self.button_offsets.append(len(self.button_masks))
+        self.joltage.extend(joltage)
+        self.joltage_offsets.append(len(self.joltage))
+
+    def __len__(self) -> int:
+        return len(self.light_masks)
+
+    def compact(self, i: int) -> tuple[int, int, tuple[int, ...], tuple[int, ...]]:
+        """Machine i as `compact_machine` would serialize it, straight from the arrays."""
+        return (
+            self.num_lights[i],
+            self.light_masks[i],
+            tuple(self.button_masks[self.button_offsets[i]:self.button_offsets[i + 1]]),
+            tuple(self.joltage[self.joltage_offsets[i]:self.joltage_offsets[i + 1]]),
+        )
+
+    def __getitem__(self, i: int) -> Machine:
+        return Machine(*self.compact(i))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def parse_input(input_data) -> MachineBatch:
+    """Parse every machine in a single regex pass over the raw text."""
+    machines = MachineBatch()
+    for match in MACHINE_PATTERN.finditer(input_data):
+        lights, buttons, joltage = match.groups()
+        if len(lights) > 64:
+            raise ValueError(f"Machine with {len(lights)} lights does not fit a 64-bit mask")
+
+        # Light i is bit i, so reverse before reading the string as binary
+        light_mask = int(lights[::-1].translate(LIGHT_BITS) or '0', 2)
+        button_masks = []
+        for button in BUTTON_PATTERN.findall(buttons):
+            mask = 0
+            for index in button.split(','):
+                mask |= 1 << int(index)
+            button_masks.append(mask)
+        machines.append(len(lights), light_mask, button_masks, map(int, joltage.split(',')))
+    return machines
 
-def apply_button_joltage(joltage: list[int], button: list[int]) -> list[int]:
-    """Apply a button press to the joltage state."""
-    new_joltage = joltage.copy()
+def lights_to_mask(lights: list[bool]) -> int:
+    """Encode a light state as an int with bit i set when light i is on."""
+    mask = 0
+    for i, light in enumerate(lights):
+        if light:
+            mask |= 1 << i
+    return mask
+
+def button_to_mask(button: list[int]) -> int:
+    """Encode a button as the bitmask of the lights it toggles."""
+    mask = 0
     for index in button:
-        new_joltage[index] += 1
-    return new_joltage
+        mask |= 1 << index
+    return mask
 
 def solve_lights(machine: Machine) -> int:
-    """Find minimum button presses using BFS."""
+    """Find minimum button presses using BFS over bitmask states."""
 
-    target = tuple(machine.lights)
-    start = tuple([False] * len(machine.lights))
+    target = machine.light_mask
+    start = 0
 
     if start == target:
         return 0
 
-    # BFS to find shortest path
+    button_masks = machine.button_masks
+
+    # BFS to find shortest path; a button press is a single XOR
     queue = deque([(start, 0)])  # (state, presses)
     visited = {start}
 
@@ -79,8 +187,8 @@ def solve_lights(machine: Machine) -> int:
         current_state, presses = queue.popleft()
 
         # Try pressing each button
-        for button in machine.buttons:
-            new_state = tuple(apply_button_lights(list(current_state), button))
+        for button_mask in button_masks:
+            new_state = current_state ^ button_mask
 
             if new_state == target:
                 return presses + 1
@@ -92,68 +200,122 @@ def solve_lights(machine: Machine) -> int:
     # No solution found
     return -1
 
-def a_star_manhattan(current: tuple[int,...], target: tuple[int,...]) -> int:
-    """Heuristic for A* search: sum of differences."""
-    return sum(abs(c - t) for c, t in zip(current, target))
-
-def a_star_button_presses(current: tuple[int,...], target: tuple[int,...], buttons: list[list[int]]) -> int:
-    """Heuristic for A* search: minimum button presses needed (not admissible)."""
-    diff = [t - c for c, t in zip(current, target)]
-    presses = 0
-    for button in buttons:
-        min_increase = min(diff[i] for i in button)
-        if min_increase > 0:
-            presses += min_increase
-            for i in button:
-                diff[i] -= min_increase
-    return presses
-
-def solve_joltage_bfs_pruned(machine: Machine) -> int:
-    """BFS with aggressive pruning - only keep states on the Pareto frontier."""
-    target = tuple(machine.joltage)
-    start = tuple([0] * len(machine.joltage))
+def solve_lights_gf2(machine: Machine) -> int:
+    """Find minimum button presses with Gaussian elimination over GF(2).
 
-    if start == target:
+    Pressing a button twice cancels out, so a solution is a subset of
+    buttons whose masks XOR to the target. Elimination gives one such
+    subset plus a basis of the null space (button subsets that XOR to 0);
+    every solution is the particular one XOR a combination of null-space
+    vectors. Enumerating those costs 2^(buttons - rank) instead of 2^lights.
+    """
+    target = machine.light_mask
+
+    # pivot bit -> (light mask, button subset producing it)
+    basis: dict[int, tuple[int, int]] = {}
+    null_space: list[int] = []
+
+    for button_idx, vector in enumerate(machine.button_masks):
+        combo = 1 << button_idx
+        while vector:
+            pivot = vector.bit_length() - 1
+            if pivot not in basis:
+                basis[pivot] = (vector, combo)
+                break
+            basis_vector, basis_combo = basis[pivot]
+            vector ^= basis_vector
+            combo ^= basis_combo
+        else:
+            null_space.append(combo)
+
+    # Reduce the target to find one particular solution
+    vector, solution = target, 0
+    while vector:
+        pivot = vector.bit_length() - 1
+        if pivot not in basis:
+            return -1  # Target is not reachable
+        basis_vector, basis_combo = basis[pivot]
+        vector ^= basis_vector
+        solution ^= basis_combo
+
+    # Walk all null-space combinations in Gray code order (one XOR per step)
+    best = solution.bit_count()
+    for step in range(1, 1 << len(null_space)):
+        solution ^= null_space[(step & -step).bit_length() - 1]
+        best = min(best, solution.bit_count())
+
+    return best
+
+def joltage_heuristic(remaining: list[int], max_coverage: int) -> int:
+    """Admissible A* heuristic: a lower bound on the presses still needed.
+
+    One press raises every index by at most 1, and raises the total by at
+    most `max_coverage` (the size of the largest button).
+    """
+    if max_coverage == 0:
         return 0
+    total = sum(remaining)
+    return max(max(remaining, default=0), -(-total // max_coverage))
+
+def solve_joltage_astar(machine: Machine, use_heuristic: bool = True,
+                        max_states: int = 5_000_000) -> int:
+    """Solve joltage problem with A* (or Dijkstra without the heuristic).
+
+    States are packed into one int with mixed radix (target[i] + 1) per
+    index, so pressing a button is a single addition. Buttons that would
+    overshoot a target are skipped. The heuristic is consistent, so a
+    state is final the first time it is expanded. Raises RuntimeError when
+    more than `max_states` states have been seen.
+    """
+    target = machine.joltage
+    num_indices = len(target)
 
-    # Use deque for BFS
-    from collections import deque
-    queue = deque([(start, 0)])  # (state, presses)
-
-    # Track best cost to reach each state
-    best_cost = {start: 0}
-
-    while queue:
-        current_state, presses = queue.popleft()
-
-        # Skip if we've found a better path to this state
-        if presses > best_cost.get(current_state, float('inf')):
-            continue
-
-        # Check if we reached target
-        if current_state == target:
+    # place[i] is the weight of index i in the packed state
+    place = [1] * num_indices
+    for i in range(1, num_indices):
+        place[i] = place[i - 1] * (target[i - 1] + 1)
+    goal = sum(t * p for t, p in zip(target, place))
+
+    buttons = machine.buttons
+    button_deltas = [sum(place[i] for i in button) for button in buttons]
+    max_coverage = max((mask.bit_count() for mask in machine.button_masks), default=0)
+
+    def heuristic(state: int) -> int:
+        if not use_heuristic:
+            return 0
+        remaining = [t - (state // p) % (t + 1) for t, p in zip(target, place)]
+        return joltage_heuristic(remaining, max_coverage)
+
+    best_cost = {0: 0}
+    closed = set()
+    heap = [(heuristic(0), 0, 0)]  # (estimate, presses, state)
+    expanded = 0
+    progress = Progress(log, "A*: expanded %d states, frontier %d, presses %d")
+
+    while heap:
+        _, presses, state = heapq.heappop(heap)
+        if state == goal:
             return presses
+        if state in closed:
+            continue
+        closed.add(state)
 
-        # Try each button
-        for button in machine.buttons:
-            new_state = list(current_state)
-
-            # Apply button (increment indices)
-            for idx in button:
-                new_state[idx] += 1
-
-            new_state = tuple(new_state)
+        expanded += 1
+        progress.update(expanded, len(heap), presses)
 
-            # Aggressive pruning: skip if any index overshoots
-            if any(s > t for s, t in zip(new_state, target)):
+        digits = [(state // p) % (t + 1) for t, p in zip(target, place)]
+        for button, delta in zip(buttons, button_deltas):
+            # Skip if any index would overshoot its target
+            if any(digits[i] >= target[i] for i in button):
                 continue
 
+            new_state = state + delta
             new_presses = presses + 1
-
-            # Only explore if we found a better path
-            if new_presses < best_cost.get(new_state, float('inf')):
+            if new_presses < best_cost.get(new_state, new_presses + 1):
                 best_cost[new_state] = new_presses
-                queue.append((new_state, new_presses))
+                if len(best_cost) > max_states:
+                    raise RuntimeError(f"A* search exceeded {max_states} states")
+                heapq.heappush(heap, (new_presses + heuristic(new_state), new_presses, new_state))
 
     return -1
 
@@ -165,76 +327,307 @@ def solve_joltage_scipy(machine: Machine) -> int:
     - Constraints: Sum of button presses must equal target joltage for each index
     - Objective: Minimize total button presses (sum of all x[i])
     """
+    if scipy is None:
+        raise RuntimeError("The scipy engine needs numpy and scipy installed")
+
     target = np.array(machine.joltage)
-    num_buttons = len(machine.buttons)
-    num_indices = len(target)
+    num_buttons = len(machine.button_masks)
 
-    # Build constraint matrix A where A[i][j] = 1 if button j affects index i
-    A_eq = np.zeros((num_indices, num_buttons))
-    for button_idx, button in enumerate(machine.buttons):
-        for affected_idx in button:
-            A_eq[affected_idx][button_idx] = 1
+    # Constraint matrix A where A[i][j] = 1 if button j affects index i
+    A_eq = machine.incidence
 
     # Objective: minimize sum of button presses (all coefficients are 1)
     c = np.ones(num_buttons)
 
-    # Bounds: each button press count must be >= 0
-    bounds = [(0, None) for _ in range(num_buttons)]
-
-    # Solve using linear programming
-    result = scipy.optimize.linprog(
-        c=c,              # Minimize sum of button presses
-        A_eq=A_eq,        # Equality constraints matrix
-        b_eq=target,      # Target joltage values
-        bounds=bounds,    # Non-negative button presses
-        method='highs'    # Use HiGHS solver (fastest)
+    # Solve directly as MILP (Mixed Integer Linear Programming)
+    result = scipy.optimize.milp(
+        c=c,
+        constraints=scipy.optimize.LinearConstraint(A_eq, target, target),
+        bounds=scipy.optimize.Bounds(0, np.inf),
+        integrality=np.ones(num_buttons)  # All variables must be integers
     )
 
     if not result.success:
         return -1
 
-    # Round solution to nearest integer (LP gives float solutions)
-    # For integer solutions, we should use integer programming, but rounding works if solution is close
-    button_presses = np.round(result.x).astype(int)
-
-    # Verify the solution is correct
-    achieved = np.zeros(num_indices, dtype=int)
-    for button_idx, presses in enumerate(button_presses):
-        for affected_idx in machine.buttons[button_idx]:
-            achieved[affected_idx] += presses
-
-    if not np.array_equal(achieved, target):
-        # LP solution didn't round correctly, need integer programming
-        # Fall back to MILP (Mixed Integer Linear Programming)
-        result = scipy.optimize.milp(
-            c=c,
-            constraints=scipy.optimize.LinearConstraint(A_eq, target, target),
-            bounds=scipy.optimize.Bounds(0, np.inf),
-            integrality=np.ones(num_buttons)  # All variables must be integers
-        )
-
-        if not result.success:
-            return -1
-
-        button_presses = result.x.astype(int)
+    return int(np.sum(np.round(result.x)))
 
-    return int(np.sum(button_presses))
+def reduce_joltage_system(machine: Machine):
+    """Row-reduce A x = joltage over the rationals.
 
+    Returns (pivot_rows, free_cols) where every pivot row is an integer
+    equation D * x[pivot] = R - sum(M[j] * x[free_cols[j]]) given as
+    (pivot, D, R, M), or None if the system has no solution at all.
+    """
+    num_buttons = len(machine.button_masks)
+    num_indices = len(machine.joltage)
+
+    # Augmented matrix [A | joltage]
+    rows = [[Fraction(mask >> i & 1) for mask in machine.button_masks] + [Fraction(target)]
+            for i, target in enumerate(machine.joltage)]
+
+    # Gauss-Jordan elimination to reduced row echelon form
+    pivot_cols = []
+    rank = 0
+    for col in range(num_buttons):
+        pivot = next((i for i in range(rank, num_indices) if rows[i][col] != 0), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        pivot_value = rows[rank][col]
+        rows[rank] = [value / pivot_value for value in rows[rank]]
+        for i in range(num_indices):
+            factor = rows[i][col]
+            if i != rank and factor != 0:
+                rows[i] = [a - factor * b for a, b in zip(rows[i], rows[rank])]
+        pivot_cols.append(col)
+        rank += 1
+
+    # A zero row with a non-zero target is a contradiction
+    if any(rows[i][-1] != 0 for i in range(rank, num_indices)):
+        return None
+
+    free_cols = [col for col in range(num_buttons) if col not in pivot_cols]
+    pivot_rows = []
+    for i, pivot in enumerate(pivot_cols):
+        coefficients = [rows[i][col] for col in free_cols] + [rows[i][-1]]
+        scale = lcm(*(value.denominator for value in coefficients))
+        pivot_rows.append((
+            pivot,
+            scale,
+            int(rows[i][-1] * scale),
+            [int(rows[i][col] * scale) for col in free_cols],
+        ))
+    return pivot_rows, free_cols
+
+def solve_joltage_exact(machine: Machine) -> int:
+    """Solve joltage problem exactly without external dependencies.
+
+    Elimination leaves a few free buttons; every other press count follows
+    from them. Each free button is bounded by the smallest target it
+    contributes to, so the free buttons are enumerated depth-first with
+    feasibility and cost pruning. The last free button is not enumerated:
+    the objective is linear in it, so its feasible range is scanned from
+    the cheaper end and the first integral solution is taken.
+    """
+    reduced = reduce_joltage_system(machine)
+    if reduced is None:
+        return -1
+    pivot_rows, free_cols = reduced
+
+    upper = [min((target for i, target in enumerate(machine.joltage)
+                  if machine.button_masks[col] >> i & 1), default=0)
+             for col in free_cols]
+    scales = [scale for _, scale, _, _ in pivot_rows]
+    coefficients = [row[3] for row in pivot_rows]
+
+    # Objective = sum(free) + sum(pivots) = sum(R / D) + sum(weight[j] * free[j])
+    weights = [1 - sum(Fraction(M[j], D) for D, M in zip(scales, coefficients))
+               for j in range(len(free_cols))]
+
+    best = None
+
+    def finish(residuals, free_sum):
+        """Cost of the assignment if every pivot is a non-negative integer."""
+        total = free_sum
+        for residual, scale in zip(residuals, scales):
+            if residual < 0 or residual % scale:
+                return None
+            total += residual // scale
+        return total
+
+    def solve_last(residuals, free_sum):
+        j = len(free_cols) - 1
+        lo, hi = 0, upper[j]
+        for residual, M in zip(residuals, coefficients):
+            if M[j] > 0:
+                hi = min(hi, residual // M[j])
+            elif M[j] < 0:
+                lo = max(lo, -(residual // -M[j]))
+            elif residual < 0:
+                return None
+        values = range(lo, hi + 1) if weights[j] >= 0 else range(hi, lo - 1, -1)
+        for value in values:
+            total = finish([r - M[j] * value for r, M in zip(residuals, coefficients)],
+                           free_sum + value)
+            if total is not None:
+                return total
+        return None
+
+    def search(k, residuals, free_sum):
+        nonlocal best
+        if k == len(free_cols) - 1:
+            total = solve_last(residuals, free_sum)
+            if total is not None and (best is None or total < best):
+                best = total
+            return
+
+        # Prune if some pivot stays negative whatever the remaining buttons do
+        for residual, M in zip(residuals, coefficients):
+            if residual + sum(-M[j] * upper[j] for j in range(k, len(free_cols)) if M[j] < 0) < 0:
+                return
+
+        # Prune if even the cheapest completion cannot beat the best so far
+        if best is not None:
+            bound = free_sum + sum(Fraction(r, D) for r, D in zip(residuals, scales))
+            bound += sum(min(0, weights[j] * upper[j]) for j in range(k, len(free_cols)))
+            if bound >= best:
+                return
+
+        for value in range(upper[k] + 1):
+            search(k + 1, [r - M[k] * value for r, M in zip(residuals, coefficients)],
+                   free_sum + value)
+
+    residuals = [R for _, _, R, _ in pivot_rows]
+    if not free_cols:
+        best = finish(residuals, 0)
+    else:
+        search(0, residuals, 0)
+
+    return -1 if best is None else best
+
+def compact_machine(machine: Machine) -> tuple[int, int, tuple[int, ...], tuple[int, ...]]:
+    """Serialize a machine as (light count, light mask, button masks, joltage)."""
+    return (machine.num_lights, machine.light_mask, machine.button_masks, machine.joltage)
+
+def expand_machine(compact: tuple[int, int, tuple[int, ...], tuple[int, ...]]) -> Machine:
+    """Rebuild a Machine from `compact_machine` output."""
+    return Machine(*compact)
+
+def solve_chunk(solver, chunk: list) -> list[tuple[int, float]]:
+    """Solve an iterable of compact machines, returning (result, seconds) for each."""
+    results = []
+    for compact in chunk:
+        start = time.perf_counter()
+        result = solver(expand_machine(compact))
+        results.append((result, time.perf_counter() - start))
+    return results
+
+def solve_machines(machines: MachineBatch | list[Machine], solver, workers: int | None = None,
+                   chunk_size: int | None = None, indices=None) -> list[tuple[int, float]]:
+    """Solve every machine (or those at `indices`), in parallel when there are enough of them.
+
+    Machines are read one at a time as compact tuples of masks and ints,
+    straight from a batch's arrays, and sent to a process pool in chunks.
+    Worker processes import this module, and with it NumPy/SciPy, once
+    each (see aoc25.pool for why that also works under the runner with
+    spawn). Results come back in input order as (result, seconds) pairs.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
 
-def part1(machines: list[Machine]) -> int:
-    res = 0
-    for machine in machines:
-        res += solve_lights(machine)
-    return res
-    
-def part2(machines: list[Machine]) -> int:
+    if indices is None:
+        indices = range(len(machines))
+    if isinstance(machines, MachineBatch):
+        compact = (machines.compact(i) for i in indices)
+    else:
+        compact = (compact_machine(machines[i]) for i in indices)
+    if workers <= 1 or len(indices) < PARALLEL_MIN_MACHINES:
+        return solve_chunk(solver, compact)
+
+    if chunk_size is None:
+        # A few chunks per worker keeps the load balanced without much overhead
+        chunk_size = max(1, len(indices) // (workers * 4))
+    chunks = iter(lambda: list(islice(compact, chunk_size)), [])
+
+    results = []
+    with process_pool(solve_chunk, workers) as executor:
+        for chunk_results in executor.map(partial(solve_chunk, solver), chunks):
+            results.extend(chunk_results)
+    return results
+
+def report_solve_times(label: str, results: list[tuple[int, float]]):
+    if not results:
+        return
+    total = sum(seconds for _, seconds in results)
+    slowest = max(range(len(results)), key=lambda i: results[i][1])
+    log.info("%s: solved %d machines in %.3fs of solver time (slowest: machine %d, %.3fs)",
+             label, len(results), total, slowest, results[slowest][1])
+
+def lights_signature(machine: Machine) -> tuple:
+    return ('lights',) + canonical_signature(machine.button_masks, machine.lights)
+
+def joltage_signature(machine: Machine) -> tuple:
+    return ('joltage',) + canonical_signature(machine.button_masks, machine.joltage)
+
+def solve_machines_cached(machines: MachineBatch | list[Machine], solver, signature,
+                          cache: SolveCache, workers: int | None = None) -> list[tuple[int, float]]:
+    """`solve_machines`, but each distinct canonical machine is solved only once.
+
+    Machines already in the cache, or repeating an earlier machine of the
+    same batch, are reported with a solve time of 0.
+
+    A signature costs a colour refinement and up to 720 relabelings, so this
+    only pays off for solvers slower than that. It does for joltage, but a
+    GF(2) lights solve takes microseconds: on the real input, caching
+    part 1 makes it about 50 times slower.
+    """
+    cache.reset_stats()
+    keys = [signature(machine) for machine in machines]
+    results: list[tuple[int, float] | None] = [None] * len(keys)
+    pending: dict[tuple, int] = {}  # key -> first machine needing it
+
+    for i, key in enumerate(keys):
+        if key in pending:
+            cache.hits += 1
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            results[i] = (cached, 0.0)
+        else:
+            pending[key] = i
+
+    solved = solve_machines(machines, solver, workers, indices=list(pending.values()))
+    for (key, i), (result, seconds) in zip(pending.items(), solved):
+        cache.put(key, result)
+        results[i] = (result, seconds)
+    cache.flush()
+
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            results[i] = (results[pending[key]][0], 0.0)
+    return results
+
+def part1(machines: MachineBatch | list[Machine], solver=solve_lights_gf2, workers: int = 1,
+          cache: SolveCache | None = None) -> int:
+    """Fewest presses for every machine's lights.
+
+    A GF(2) solve takes microseconds, far less than starting a worker, so
+    this runs in-process unless `workers` asks otherwise.
+    """
+    with phase("solve lights"):
+        if cache is None:
+            results = solve_machines(machines, solver, workers)
+        else:
+            results = solve_machines_cached(machines, solver, lights_signature, cache, workers)
+    if cache is not None:
+        cache.report("Lights")
+    report_solve_times("Lights", results)
+    return sum(result for result, _ in results)
+
+def part2(machines: MachineBatch | list[Machine], solver=solve_joltage_exact, workers: int | None = None,
+          cache: SolveCache | None = None) -> int:
+    with phase("solve joltage"):
+        if cache is None:
+            results = solve_machines(machines, solver, workers)
+        else:
+            results = solve_machines_cached(machines, solver, joltage_signature, cache, workers)
+    if cache is not None:
+        cache.report("Joltage")
     res = 0
-    for i, machine in enumerate(machines):
-        result = solve_joltage_scipy(machine)
+    for i, (result, seconds) in enumerate(results):
         res += result
-        print(f"Joltage for machine {i} solved with result {res}")
+        log.debug("Joltage for machine %d solved with result %d in %.4fs", i, res, seconds)
+    report_solve_times("Joltage", results)
     return res
 
+def parse(text: str) -> MachineBatch:
+    return parse_input(text)
+
+def solve(text: str) -> tuple[int, int]:
+    machines = parse(text)
+    return part1(machines), part2(machines)
+
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -244,14 +637,24 @@ def main():
         input_file = sys.stdin
 
     input_data = input_file.read()
-    machines = parse_input(input_data)
+    with phase("parse"):
+        machines = parse_input(input_data)
     # for i, machine in enumerate(machines):
     #     print(f"Machine {i}:")
     #     machine.print_machine()
 
-    print(f"Part 1: {part1(machines)}")
-    print(f"Part 2: {part2(machines)}")
+    # Joltage results persist across runs when DAY10_CACHE names an SQLite
+    # file. Lights solve faster than their signatures are built, so part 1
+    # is not cached
+    cache = SolveCache(path=os.environ.get('DAY10_CACHE'))
+    with phase("part 1"):
+        res1 = part1(machines)
+    answer(1, res1)
+    with phase("part 2"):
+        res2 = part2(machines, cache=cache)
+    answer(2, res2)
+    cache.close()
 
 
 if __name__ == "__main__":
-    main()
+    run_script(main)
@@ -0,0 +1,141 @@
+"""Memoization of day 10 results keyed by a canonical machine signature."""
+
+import sqlite3
+
+from collections import OrderedDict
+from itertools import permutations, product
+from math import factorial
+
+from aoc25.log import get_logger
+
+log = get_logger("day10")
+
+# Give up searching tie permutations beyond this many candidates
+CANONICAL_SEARCH_LIMIT = 720
+
+
+def _refine_colors(button_masks, targets):
+    """Colour indices by target value and how they sit among the buttons.
+
+    Starts from the target of each index and repeatedly folds in the colours
+    of the buttons touching it (colour refinement), until the partition
+    stops splitting. Equal colours are what a relabeling may still swap.
+    """
+    n = len(targets)
+    colors = list(targets)
+    num_classes = len(set(colors))
+    for _ in range(n):
+        button_colors = [tuple(sorted(colors[i] for i in range(n) if mask >> i & 1))
+                         for mask in button_masks]
+        signatures = [(colors[i], tuple(sorted(button_colors[b] for b, mask in enumerate(button_masks)
+                                               if mask >> i & 1)))
+                      for i in range(n)]
+        ranks = {signature: rank for rank, signature in enumerate(sorted(set(signatures)))}
+        colors = [ranks[signature] for signature in signatures]
+        if len(ranks) == num_classes:
+            break
+        num_classes = len(ranks)
+    return colors
+
+
+def _relabel(button_masks, targets, order):
+    """Machine key with index order[k] renamed to k and buttons sorted."""
+    position = {old: new for new, old in enumerate(order)}
+    masks = []
+    for mask in button_masks:
+        relabeled = 0
+        for old, new in position.items():
+            if mask >> old & 1:
+                relabeled |= 1 << new
+        masks.append(relabeled)
+    return tuple(targets[old] for old in order), tuple(sorted(masks))
+
+
+def canonical_signature(button_masks, targets) -> tuple:
+    """Signature shared by machines equal up to button order and index relabeling.
+
+    Indices are ordered by their refined colour. When colours tie, every
+    order of the tied indices is tried (up to CANONICAL_SEARCH_LIMIT) and
+    the smallest key wins. Past the limit the first order is used, which
+    can only cost a cache hit, never give a wrong answer.
+    """
+    targets = [int(target) for target in targets]
+    colors = _refine_colors(button_masks, targets)
+
+    groups = {}
+    for i in sorted(range(len(targets)), key=lambda i: colors[i]):
+        groups.setdefault(colors[i], []).append(i)
+    groups = [groups[color] for color in sorted(groups)]
+
+    candidates = 1
+    for group in groups:
+        candidates *= factorial(len(group))
+    if candidates > CANONICAL_SEARCH_LIMIT:
+        return _relabel(button_masks, targets, [i for group in groups for i in group])
+
+    return min(_relabel(button_masks, targets, [i for part in parts for i in part])
+               for parts in product(*(permutations(group) for group in groups)))
+
+
+class SolveCache:
+    """LRU cache of results with an optional SQLite store shared across runs."""
+    def __init__(self, maxsize: int = 100_000, path: str | None = None):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value INTEGER)")
+
+    def get(self, key):
+        """Look up a key, counting the hit or miss. Returns None when absent."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.db is not None:
+            row = self.db.execute("SELECT value FROM results WHERE key = ?", (repr(key),)).fetchone()
+            if row is not None:
+                self.hits += 1
+                self._remember(key, row[0])
+                return row[0]
+
+        self.misses += 1
+        return None
+
+    def put(self, key, value: int):
+        self._remember(key, value)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?)", (repr(key), value))
+
+    def _remember(self, key, value: int):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def flush(self):
+        if self.db is not None:
+            self.db.commit()
+
+    def close(self):
+        if self.db is not None:
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self, label: str):
+        log.info("%s cache: %d/%d hits (%.1f%%), %d entries in memory",
+                 label, self.hits, self.hits + self.misses, 100 * self.hit_rate, len(self.entries))
@@ -0,0 +1,5 @@
+"""Run the daily solutions in one interpreter: `python -m aoc25 run 08`."""
+
+from .runner import available_days, load_day, read_input, run_day
+
+__all__ = ['available_days', 'load_day', 'read_input', 'run_day']
@@ -0,0 +1,78 @@
+import argparse
+import json
+import logging
+import sys
+
+from . import log
+from .bench import run_benchmarks
+from .instrument import add_arguments, instrumented
+from .runner import available_days, read_input, run_day
+
+
+def parse_days(values: list[str]) -> list[int]:
+    if values == ['all']:
+        return available_days()
+    return [int(value) for value in values]
+
+
+def cmd_run(args) -> int:
+    days = parse_days(args.days)
+    if args.input is not None and len(days) != 1:
+        print("--input needs exactly one day", file=sys.stderr)
+        return 2
+
+    log.configure(logging.INFO if args.verbose else logging.WARNING)
+    with instrumented(args.timings, args.profile, args.memtrace):
+        for day in days:
+            text = read_input(day, args.input, args.example)
+            result = run_day(day, text, args.module)
+            timings = result['timings']
+            if args.json:
+                # One object per line, so a run over several days stays parseable
+                print(json.dumps(result), flush=True)
+                continue
+            print(f"Day {day:02d}: part 1 = {result['part1']}, part 2 = {result['part2']} "
+                  f"(parse {timings['parse']:.3f}s, part 1 {timings['part1']:.3f}s, "
+                  f"part 2 {timings['part2']:.3f}s)")
+    return 0
+
+
+def cmd_bench(args) -> int:
+    report = run_benchmarks(parse_days(args.days), args.scale, args.repeat, args.seed)
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump(report, output, indent=2)
+        print(f"Wrote {len(report['results'])} results to {args.json}")
+    # Engines answering the same part differently is a failure
+    return 0 if report['agree'] else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='aoc25')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="solve one or more days in this process")
+    run.add_argument('days', nargs='+', help="day numbers, or 'all'")
+    run.add_argument('--input', help="input file ('-' for stdin), default NN/input.txt")
+    run.add_argument('--example', action='store_true', help="use NN/example.txt instead")
+    run.add_argument('--module', default='main', help="day module to load, e.g. main_fast")
+    run.add_argument('--verbose', action='store_true', help="show the days' progress log on stderr")
+    run.add_argument('--json', action='store_true', help="print each day's answers and timings as JSON")
+    add_arguments(run)
+    run.set_defaults(handler=cmd_run)
+
+    bench = commands.add_parser('bench', help="time every engine on synthetic inputs")
+    bench.add_argument('days', nargs='+', help="day numbers, or 'all'")
+    bench.add_argument('--scale', type=float, nargs='+', default=[1.0],
+                       help="input sizes relative to the real input, e.g. 10 100")
+    bench.add_argument('--repeat', type=int, default=3, help="timed runs per engine")
+    bench.add_argument('--seed', type=int, default=0, help="generator seed")
+    bench.add_argument('--json', help="write the results to this file")
+    bench.set_defaults(handler=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Benchmark every day's engines on synthetic inputs of chosen sizes."""
+
+import contextlib
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import time
+
+from .generators import generate
+from .runner import REPO_ROOT, load_day
+
+# (module, function) pairs timed per day; each function takes parse() output,
+# or the output of the module's function named by an optional third element
+ENGINES = {
+    3: [('main', 'part1'), ('main', 'part2'), ('main', 'part2optimal')],
+    4: [('main', 'part1'), ('main', 'part2'),
+        ('main', 'part1_bits', 'parse_bits'), ('main', 'part2_bits', 'parse_bits')],
+    7: [('main', 'part1'), ('main', 'part2'), ('main', 'part1_table'), ('main', 'part2_table')],
+    9: [('main', 'part1'), ('main', 'part2'), ('main_fast', 'part2')],
+}
+DEFAULT_ENGINES = [('main', 'part1'), ('main', 'part2')]
+
+
+def engines_for(day: int) -> list[tuple[str, str, str]]:
+    """(module, function, parser) for every engine of a day."""
+    return [(module, function, parser[0] if parser else 'parse')
+            for module, function, *parser in ENGINES.get(day, DEFAULT_ENGINES)]
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set of this process in kilobytes.
+
+    Linux carries ru_maxrss over exec, so even a spawned child would report
+    its parent's peak; the VmHWM line of /proc/self/status starts afresh.
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(day: int, module: str, function: str, text: str, repeats: int, parser: str = 'parse') -> dict:
+    """Time parse + function `repeats` times; runs inside a fresh child process."""
+    day_module = load_day(day, module)
+    parse = getattr(day_module, parser)
+    parse_times, times = [], []
+    answer = None
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeats):
+            # Parse again every round: some parts mutate their input
+            start = time.perf_counter()
+            data = parse(text)
+            parse_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            answer = getattr(day_module, function)(data)
+            times.append(time.perf_counter() - start)
+
+    return {
+        'parse_times': parse_times,
+        'times': times,
+        'answer': answer,
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+def _child(connection, *args):
+    try:
+        connection.send(_measure(*args))
+    except Exception as error:
+        connection.send({'error': f"{type(error).__name__}: {error}"})
+    finally:
+        connection.close()
+
+
+def measure_isolated(day: int, module: str, function: str, text: str, repeats: int,
+                     parser: str = 'parse') -> dict:
+    """Run `_measure` in a fresh interpreter so peak RSS belongs to this engine alone.
+
+    A forked child starts with everything the parent had resident and
+    counts it in its peak, so results would drift with the parent's memory.
+    A spawned one starts from a bare interpreter, whose few MiB are the
+    same for every engine (see peak_rss_kb for reading it).
+    """
+    context = multiprocessing.get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(sender, day, module, function, text, repeats, parser))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {'error': "benchmark process died"}
+    process.join()
+    return result
+
+
+def part_of(function: str) -> str:
+    """The part an engine answers: part1_bits -> part1, part2optimal -> part2."""
+    match = re.match(r'part\d', function)
+    return match.group() if match else function
+
+
+def check_agreement(entries: list[dict], report=print) -> bool:
+    """Flag engines whose answer differs from the first engine for the same part."""
+    agree = True
+    first = {}
+    for entry in entries:
+        if 'answer' not in entry:
+            continue
+        part = part_of(entry['function'])
+        if part not in first:
+            first[part] = entry
+            continue
+        reference = first[part]
+        entry['agrees'] = entry['answer'] == reference['answer']
+        if not entry['agrees']:
+            agree = False
+            report(f"Day {entry['day']:02d} x{entry['scale']:g}: {entry['module']}.{entry['function']} = "
+                   f"{entry['answer']}, but {reference['module']}.{reference['function']} = {reference['answer']}")
+    return agree
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(days: list[int], scales: list[float], repeats: int = 3, seed: int = 0,
+                   report=print) -> dict:
+    results = []
+    agree = True
+    for day in days:
+        for scale in scales:
+            text = generate(day, scale, seed)
+            entries = []
+            for module, function, parser in engines_for(day):
+                measured = measure_isolated(day, module, function, text, repeats, parser)
+                entry = {
+                    'day': day,
+                    'module': module,
+                    'function': function,
+                    'scale': scale,
+                    'seed': seed,
+                    'input_bytes': len(text),
+                    'repeats': repeats,
+                    **measured,
+                }
+                if 'times' in measured:
+                    entry['best'] = min(measured['times'])
+                    entry['mean'] = statistics.mean(measured['times'])
+                    entry['parse_best'] = min(measured['parse_times'])
+                    report(f"Day {day:02d} {module + '.' + function:<22} x{scale:<6g} "
+                           f"best {entry['best']:.4f}s  mean {entry['mean']:.4f}s  "
+                           f"parse {entry['parse_best']:.4f}s  peak RSS {entry['peak_rss_kb'] / 1024:.1f} MiB")
+                else:
+                    report(f"Day {day:02d} {module + '.' + function:<22} x{scale:<6g} failed: {measured['error']}")
+                entries.append(entry)
+            agree = check_agreement(entries, report) and agree
+            results.extend(entries)
+
+    return {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'timestamp': time.time(),
+        'agree': agree,
+        'results': results,
+    }
+
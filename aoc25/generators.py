@@ -0,0 +1,152 @@
+"""Seeded synthetic inputs shaped like each day's puzzle input.
+
+`scale` multiplies the size of the real input: the number of records for
+list-like inputs, the area for grids and the width for day 06 sheets.
+"""
+
+import math
+import random
+
+
+def day01(scale: float, rnd: random.Random) -> str:
+    count = max(1, round(4779 * scale))
+    return ''.join(f"{rnd.choice('LR')}{rnd.randint(1, 999)}\n" for _ in range(count))
+
+
+def day02(scale: float, rnd: random.Random) -> str:
+    count = max(1, round(31 * scale))
+    ranges = []
+    for _ in range(count):
+        digits = rnd.randint(2, 10)
+        start = rnd.randint(10 ** (digits - 1), 10 ** digits - 1)
+        ranges.append(f"{start}-{start + rnd.randint(0, 60000)}")
+    return ','.join(ranges) + '\n'
+
+
+def day03(scale: float, rnd: random.Random) -> str:
+    count = max(1, round(200 * scale))
+    return ''.join(''.join(rnd.choice('123456789') for _ in range(100)) + '\n' for _ in range(count))
+
+
+def day04(scale: float, rnd: random.Random) -> str:
+    side = max(3, round(135 * math.sqrt(scale)))
+    return ''.join(''.join('@' if rnd.random() < 0.6 else '.' for _ in range(side)) + '\n'
+                   for _ in range(side))
+
+
+def day05(scale: float, rnd: random.Random) -> str:
+    num_ranges = max(1, round(173 * scale))
+    num_ids = max(1, round(1000 * scale))
+    top = 10 ** 15
+    lines = []
+    for _ in range(num_ranges):
+        start = rnd.randint(1, top)
+        lines.append(f"{start}-{start + rnd.randint(0, top // 100)}")
+    lines.append('')
+    lines.extend(str(rnd.randint(1, top)) for _ in range(num_ids))
+    return '\n'.join(lines) + '\n'
+
+
+def day06(scale: float, rnd: random.Random) -> str:
+    num_problems = max(1, round(1000 * scale))
+    rows = [[] for _ in range(4)]
+    operators = []
+    for _ in range(num_problems):
+        width = rnd.randint(1, 4)
+        for row in rows:
+            number = str(rnd.randint(1, 10 ** rnd.randint(1, width) - 1))
+            row.append(number.ljust(width) if rnd.random() < 0.5 else number.rjust(width))
+        operators.append(rnd.choice('+*').ljust(width))
+    lines = [' '.join(row) for row in rows] + [' '.join(operators)]
+    return '\n'.join(lines) + '\n'
+
+
+def day07(scale: float, rnd: random.Random) -> str:
+    width = 141
+    height = max(4, round(142 * scale))
+    start = width // 2
+    lines = ['.' * start + 'S' + '.' * (width - start - 1)]
+    for row in range(1, height):
+        if row % 2:
+            lines.append('.' * width)
+        else:
+            # Keep splitters off the edges so a split never leaves the grid, and
+            # never side by side (as in the real input; part1 depends on set
+            # order when two splitters touch)
+            cells = []
+            for _ in range(width - 2):
+                cells.append('^' if cells[-1:] != ['^'] and rnd.random() < 0.3 else '.')
+            lines.append('.' + ''.join(cells) + '.')
+    return '\n'.join(lines) + '\n'
+
+
+def day08(scale: float, rnd: random.Random) -> str:
+    count = max(4, round(1000 * scale))
+    return ''.join(f"{rnd.randint(0, 99999)},{rnd.randint(0, 99999)},{rnd.randint(0, 99999)}\n"
+                   for _ in range(count))
+
+
+def day09(scale: float, rnd: random.Random) -> str:
+    """A rectilinear polygon: a staircase top edge over a staircase bottom edge."""
+    columns = max(2, round(124 * scale))
+    step = max(1, 100000 // columns)
+    tops = [rnd.randint(50001, 99999) for _ in range(columns)]
+    bottoms = [rnd.randint(1, 49999) for _ in range(columns)]
+
+    points = []
+    for k, top in enumerate(tops):
+        points.extend([(k * step, top), ((k + 1) * step, top)])
+    for k in range(columns - 1, -1, -1):
+        points.extend([((k + 1) * step, bottoms[k]), (k * step, bottoms[k])])
+
+    # Drop vertices that repeat or sit in the middle of a straight edge
+    vertices = []
+    for i, point in enumerate(points):
+        before, after = points[i - 1], points[(i + 1) % len(points)]
+        if point == after:
+            continue
+        if before[0] == point[0] == after[0] or before[1] == point[1] == after[1]:
+            continue
+        vertices.append(point)
+    return ''.join(f"{x},{y}\n" for x, y in vertices)
+
+
+def day10(scale: float, rnd: random.Random) -> str:
+    """Machines whose light pattern and joltage are reachable by construction."""
+    count = max(1, round(197 * scale))
+    lines = []
+    for _ in range(count):
+        # Like the real input: about as many buttons as lights, each
+        # touching roughly half of them
+        num_lights = rnd.randint(4, 10)
+        num_buttons = max(2, num_lights + rnd.randint(-2, 2))
+        buttons = [sorted(rnd.sample(range(num_lights), rnd.randint(max(1, num_lights // 3),
+                                                                    max(1, 2 * num_lights // 3))))
+                   for _ in range(num_buttons)]
+
+        lights = [False] * num_lights
+        for button in buttons:
+            if rnd.random() < 0.5:
+                for i in button:
+                    lights[i] = not lights[i]
+
+        joltage = [0] * num_lights
+        for button in buttons:
+            presses = rnd.randint(0, 30)
+            for i in button:
+                joltage[i] += presses
+
+        lines.append('[' + ''.join('#' if light else '.' for light in lights) + '] '
+                     + ' '.join('(' + ','.join(map(str, button)) + ')' for button in buttons)
+                     + ' {' + ','.join(map(str, joltage)) + '}')
+    return '\n'.join(lines) + '\n'
+
+
+GENERATORS = {
+    1: day01, 2: day02, 3: day03, 4: day04, 5: day05,
+    6: day06, 7: day07, 8: day08, 9: day09, 10: day10,
+}
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    return GENERATORS[day](scale, random.Random(f"{day}:{seed}"))
@@ -0,0 +1,197 @@
+"""Bytes-level input: mmapped files, bulk NumPy parsers and chunked streams.
+
+Inputs are read once into a single buffer (a read-only mmap for regular
+files, bytes for pipes) and parsed without splitting into Python strings.
+Inputs too large to hold at once can be tokenized chunk by chunk instead.
+NumPy is optional: `int_list` and `int_tuples` fall back to a regex scan,
+while the array parsers raise RuntimeError without it.
+"""
+
+import mmap
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_INT_DIGITS = 18  # Anything longer could overflow int64
+CHUNK_SIZE = 1 << 20  # Bytes per read when streaming
+
+_UNSIGNED_INT = re.compile(rb'\d+')
+_SIGNED_INT = re.compile(rb'-?\d+')
+_TRAILING_DIGITS = re.compile(rb'\d+\Z')
+
+
+def _map_file(file) -> bytes | mmap.mmap:
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # Empty files, pipes and terminals cannot be mapped
+        return file.read()
+
+
+def _is_regular(file) -> bool:
+    try:
+        return stat.S_ISREG(os.fstat(file.fileno()).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _spool(stream) -> bytes | mmap.mmap:
+    # Copy an unmappable stream to a temporary file in constant memory
+    with tempfile.TemporaryFile() as spool_file:
+        shutil.copyfileobj(stream, spool_file)
+        spool_file.flush()
+        return _map_file(spool_file)
+
+
+def load(path: str | None = None, spool: bool = False) -> bytes | mmap.mmap:
+    """Map `path` into memory, or read all of stdin when no path is given.
+
+    With `spool`, piped stdin is copied to a temporary file and mapped
+    rather than read into memory whole.
+    """
+    if path is None:
+        if spool and not _is_regular(sys.stdin.buffer):
+            return _spool(sys.stdin.buffer)
+        return _map_file(sys.stdin.buffer)
+    with open(path, 'rb') as input_file:
+        # The mapping stays valid after the file is closed
+        return _map_file(input_file)
+
+
+def load_default(script_dir: str, spool: bool = False) -> bytes | mmap.mmap:
+    """stdin if something is piped in, else the day's example.txt."""
+    if sys.stdin.isatty():
+        return load(os.path.join(script_dir, 'example.txt'))
+    return load(spool=spool)
+
+
+def open_default(script_dir: str):
+    """Like load_default, but as a binary stream for chunked reading."""
+    if sys.stdin.isatty():
+        return open(os.path.join(script_dir, 'example.txt'), 'rb')
+    return sys.stdin.buffer
+
+
+def iter_ints(stream, chunk_size: int = CHUNK_SIZE):
+    """Yield the integers of a binary stream, reading it in fixed-size chunks.
+
+    A digit run cut by a chunk boundary is carried into the next chunk, so
+    memory stays at about one chunk whatever the size of the input.
+    """
+    carry = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer = carry + chunk
+        # Hold back a trailing digit run, the next chunk may continue it
+        trailing = _TRAILING_DIGITS.search(buffer)
+        cut = trailing.start() if trailing else len(buffer)
+        for token in _UNSIGNED_INT.findall(buffer, 0, cut):
+            yield int(token)
+        carry = buffer[cut:]
+    if carry:
+        yield int(carry)
+
+
+def as_buffer(data) -> bytes | mmap.mmap:
+    """Accept text as well, so parse() still works on what the runner reads."""
+    if isinstance(data, str):
+        return data.encode()
+    return data
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("The array parsers need numpy installed")
+
+
+def int_array(data, signed: bool = False):
+    """Every run of digits in `data` as one int64 array.
+
+    Anything that is not a digit separates numbers, so '3-5,7' gives
+    [3, 5, 7]. With `signed`, a '-' directly before a run negates it.
+    """
+    _require_numpy()
+    raw = np.frombuffer(as_buffer(data), dtype=np.uint8)
+    digits = raw - ord('0')  # Non-digits wrap around to values above 9
+    is_digit = digits < 10
+
+    # Runs of digits start where is_digit turns on and end where it turns off
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if starts.size == 0:
+        return np.empty(0, dtype=np.int64)
+    lengths = ends - starts
+    if lengths.max() > MAX_INT_DIGITS:
+        raise ValueError(f"Integer with more than {MAX_INT_DIGITS} digits does not fit int64")
+
+    # Weight each digit by 10 ** (digits left in its run), then sum per run
+    positions = np.flatnonzero(is_digit)
+    places = np.repeat(ends, lengths) - positions - 1
+    powers = 10 ** np.arange(MAX_INT_DIGITS, dtype=np.int64)
+    weighted = digits[positions].astype(np.int64) * powers[places]
+    values = np.add.reduceat(weighted, np.cumsum(lengths) - lengths)
+
+    if signed:
+        negative = np.zeros(starts.size, dtype=bool)
+        has_prefix = starts > 0
+        negative[has_prefix] = raw[starts[has_prefix] - 1] == ord('-')
+        values[negative] = -values[negative]
+    return values
+
+
+def int_list(data, signed: bool = False) -> list[int]:
+    """Like int_array, as Python ints."""
+    if np is None:
+        pattern = _SIGNED_INT if signed else _UNSIGNED_INT
+        return [int(token) for token in pattern.findall(as_buffer(data))]
+    return int_array(data, signed).tolist()
+
+
+def int_tuples(data, width: int, signed: bool = False) -> list[tuple]:
+    """Group the integers in `data` into tuples of `width`, e.g. 3-D points."""
+    values = int_list(data, signed)
+    if len(values) % width:
+        raise ValueError(f"Found {len(values)} integers, not a multiple of {width}")
+    return list(zip(*[iter(values)] * width))
+
+
+def line_offsets(data):
+    """(starts, ends) int64 arrays of every line, ends excluding the newline."""
+    _require_numpy()
+    raw = np.frombuffer(as_buffer(data), dtype=np.uint8)
+    newlines = np.flatnonzero(raw == ord('\n'))
+    ends = newlines if raw.size == 0 or raw[-1] == ord('\n') else np.append(newlines, raw.size)
+    starts = np.concatenate(([0], ends[:-1] + 1)) if ends.size else ends
+    return starts.astype(np.int64), ends.astype(np.int64)
+
+
+def grid_array(data):
+    """A rectangular text grid as a read-only (rows, cols) uint8 array.
+
+    The array is a view of the buffer itself, so copy it before changing
+    cells. Raises ValueError when the lines differ in length.
+    """
+    starts, ends = line_offsets(data)
+    if starts.size == 0:
+        return np.empty((0, 0), dtype=np.uint8)
+    width = int(ends[0] - starts[0])
+    if np.any(ends - starts != width):
+        raise ValueError("Grid lines differ in length")
+
+    raw = np.frombuffer(as_buffer(data), dtype=np.uint8)
+    rows = starts.size
+    # Pad a missing final newline so every row is width + 1 bytes
+    if raw.size < rows * (width + 1):
+        raw = np.append(raw, np.uint8(ord('\n')))
+    return raw[:rows * (width + 1)].reshape(rows, width + 1)[:, :width]
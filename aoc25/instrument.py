@@ -0,0 +1,137 @@
+"""Opt-in phase timing, cProfile and tracemalloc for the day scripts.
+
+Days wrap their expensive steps in `with phase("name"):`. While timings
+are off, `phase` hands back one shared no-op context manager, so marking
+a phase costs a global lookup and a function call.
+"""
+
+import argparse
+import contextlib
+import cProfile
+import pstats
+import sys
+import time
+import tracemalloc
+
+from . import log
+
+_NULL_PHASE = contextlib.nullcontext()
+_enabled = False
+_phases: dict[str, list] = {}  # name -> [calls, wall seconds, cpu seconds]
+
+
+class _Phase:
+    __slots__ = ('name', 'wall', 'cpu')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        totals = _phases.setdefault(self.name, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += wall
+        totals[2] += cpu
+        return False
+
+
+def phase(name: str):
+    """Context manager timing a named phase when timings are enabled."""
+    if not _enabled:
+        return _NULL_PHASE
+    return _Phase(name)
+
+
+def enable_timings():
+    global _enabled
+    _enabled = True
+
+
+def phase_totals() -> dict[str, tuple[int, float, float]]:
+    """Recorded phases as name -> (calls, wall seconds, cpu seconds)."""
+    return {name: tuple(totals) for name, totals in _phases.items()}
+
+
+def report_timings(file=sys.stderr):
+    if not _phases:
+        return
+    width = max(len(name) for name in _phases)
+    print(f"{'phase':<{width}}  {'calls':>7}  {'wall':>10}  {'cpu':>10}", file=file)
+    for name, (calls, wall, cpu) in _phases.items():
+        print(f"{name:<{width}}  {calls:>7}  {wall:>9.4f}s  {cpu:>9.4f}s", file=file)
+
+
+def report_memory(snapshot, limit: int, file=sys.stderr):
+    print(f"Top {limit} allocation sites:", file=file)
+    for stat in snapshot.statistics('lineno')[:limit]:
+        print(f"  {stat}", file=file)
+    current, peak = tracemalloc.get_traced_memory()
+    print(f"Traced memory: {current / 1024 / 1024:.1f} MiB now, {peak / 1024 / 1024:.1f} MiB peak", file=file)
+
+
+@contextlib.contextmanager
+def instrumented(timings: bool = False, profile: str | None = None, memtrace: int = 0):
+    """Run the enclosed block with the requested instrumentation, reporting to stderr.
+
+    timings  -- print wall/CPU time per phase
+    profile  -- write cProfile stats to this path (and print the top entries)
+    memtrace -- print this many top allocation sites from tracemalloc
+    """
+    if timings:
+        enable_timings()
+    if memtrace:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if profile else None
+    if profiler is not None:
+        profiler.enable()
+
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        # Snapshot before reporting so the reports' own allocations stay out of it
+        snapshot = tracemalloc.take_snapshot() if memtrace else None
+        if profiler is not None:
+            profiler.dump_stats(profile)
+            print(f"Profile written to {profile}", file=sys.stderr)
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(15)
+        if snapshot is not None:
+            report_memory(snapshot, memtrace)
+            tracemalloc.stop()
+        if timings:
+            report_timings()
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--profile', metavar='PATH', help="write a cProfile dump to PATH")
+    parser.add_argument('--timings', action='store_true', help="print wall/CPU time per phase")
+    parser.add_argument('--memtrace', type=int, nargs='?', const=10, default=0, metavar='N',
+                        help="print the top N allocation sites (default 10)")
+
+
+def run_script(main, argv=None, arguments=None):
+    """Entry point for day scripts: parse the logging and instrumentation flags, then run main().
+
+    A day with options of its own passes `arguments(parser)` to add them;
+    its main() then receives the parsed namespace.
+    """
+    parser = argparse.ArgumentParser()
+    log.add_arguments(parser)
+    add_arguments(parser)
+    if arguments is not None:
+        arguments(parser)
+    args = parser.parse_args(argv)
+    log.configure(log.level_from_args(args), json_answers=args.json)
+    with instrumented(args.timings, args.profile, args.memtrace):
+        if arguments is not None:
+            main(args)
+        else:
+            main()
+    log.flush_answers()
@@ -0,0 +1,108 @@
+"""Levelled logging to stderr, rate-limited progress and answers on stdout.
+
+Days log through `get_logger(__name__)` with %-style arguments, so a
+message below the configured level is never formatted. Progress lines are
+throttled by elapsed time, and only the answers go to stdout, either as
+"Part N: value" lines or as one JSON object with `--json`.
+"""
+
+import json
+import logging
+import sys
+import time
+
+PROGRESS_INTERVAL = 2.0  # Seconds between progress lines
+
+_root = logging.getLogger('aoc25')
+_json_answers = None  # dict of answers while --json is on, else None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger under the shared 'aoc25' tree, e.g. get_logger('day06')."""
+    return logging.getLogger(f"aoc25.{name}")
+
+
+def configure(level: int = logging.INFO, json_answers: bool = False):
+    """Send log records at `level` and above to stderr."""
+    global _json_answers
+    if not _root.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        _root.addHandler(handler)
+        _root.propagate = False
+    _root.setLevel(level)
+    _json_answers = {} if json_answers else None
+
+
+def set_level(level: int):
+    _root.setLevel(level)
+
+
+def answer(part: int, value):
+    """Report one answer: printed straight away, or kept for the JSON object."""
+    if _json_answers is not None:
+        _json_answers[f"part{part}"] = value
+    else:
+        print(f"Part {part}: {value}")
+
+
+def answer_table(name: str, columns: list[str], rows):
+    """Report a table of results, e.g. one row per configuration.
+
+    Printed as aligned columns, or kept as a list of objects under `name`
+    for the JSON output.
+    """
+    rows = [list(row) for row in rows]
+    if _json_answers is not None:
+        _json_answers[name] = [dict(zip(columns, row)) for row in rows]
+        return
+    widths = [max([len(column)] + [len(str(row[k])) for row in rows]) for k, column in enumerate(columns)]
+    print('  '.join(f"{column:>{width}}" for column, width in zip(columns, widths)))
+    for row in rows:
+        print('  '.join(f"{str(value):>{width}}" for value, width in zip(row, widths)))
+
+
+def flush_answers(**extra):
+    """Write the collected answers as one JSON object (only with --json)."""
+    if _json_answers is not None:
+        json.dump({**extra, **_json_answers}, sys.stdout)
+        sys.stdout.write('\n')
+        _json_answers.clear()
+
+
+class Progress:
+    """Logs a progress message at INFO at most once every `interval` seconds.
+
+    `update` only reads the clock; the message is formatted when a line is
+    actually due, and never when INFO is disabled.
+    """
+    __slots__ = ('log', 'message', 'interval', 'next_report', 'enabled')
+
+    def __init__(self, log: logging.Logger, message: str, interval: float = PROGRESS_INTERVAL):
+        self.log = log
+        self.message = message
+        self.interval = interval
+        self.next_report = time.monotonic() + interval
+        self.enabled = log.isEnabledFor(logging.INFO)
+
+    def update(self, *args):
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if now >= self.next_report:
+            self.next_report = now + self.interval
+            self.log.info(self.message, *args)
+
+
+def add_arguments(parser):
+    parser.add_argument('-v', '--verbose', action='store_true', help="also log per-item debug detail")
+    parser.add_argument('-q', '--quiet', action='store_true', help="only log warnings and errors")
+    parser.add_argument('--json', action='store_true', help="print the answers as one JSON object")
+
+
+def level_from_args(args) -> int:
+    if args.quiet:
+        return logging.WARNING
+    if args.verbose:
+        return logging.DEBUG
+    return logging.INFO
@@ -0,0 +1,66 @@
+"""Process pools that can run functions defined in day scripts.
+
+A pool pickles functions by module name. Day modules loaded by the runner
+are named like aoc25_day10_main and are not importable, so a worker that
+does not inherit the parent's memory (the spawn and forkserver start
+methods) could not unpickle them. process_pool loads the module into each
+such worker under the same name before it runs anything.
+"""
+
+import importlib.util
+import pickle
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.reduction import ForkingPickler
+
+
+class _Deferred:
+    """Initializer arguments a worker unpickles only after _load_module.
+
+    A started worker unpickles its initializer arguments before running
+    any code, which is too early for names from a day module. Pickled
+    while the worker is being started, these travel as bytes instead,
+    so objects that may only be shared with a new process then (locks,
+    shared Values) still pickle. A forked worker gets them as they are.
+    """
+
+    def __init__(self, value=None, data: bytes | None = None):
+        self.value = value
+        self.data = data
+
+    def __reduce__(self):
+        return _Deferred, (None, bytes(ForkingPickler.dumps(self.value)))
+
+    def load(self):
+        return self.value if self.data is None else pickle.loads(self.data)
+
+
+def _load_module(name: str, path: str | None):
+    # Forked workers and re-imported __main__ modules are already there
+    if name in sys.modules or path is None:
+        return
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+
+def _start_worker(name: str, path: str | None, deferred: _Deferred):
+    _load_module(name, path)
+    initializer, initargs = deferred.load()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def process_pool(function, workers: int, mp_context=None,
+                 initializer=None, initargs: tuple = ()) -> ProcessPoolExecutor:
+    """A ProcessPoolExecutor whose workers can unpickle `function` and its module's names.
+
+    `initializer(*initargs)` runs in each worker once that module is loaded,
+    so its arguments may refer to the module too.
+    """
+    module = sys.modules[function.__module__]
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=_start_worker,
+                               initargs=(module.__name__, getattr(module, '__file__', None),
+                                         _Deferred((initializer, initargs))))
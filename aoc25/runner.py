@@ -0,0 +1,80 @@
+"""Load day modules and run them in-process."""
+
+import importlib.util
+import sys
+import time
+
+from pathlib import Path
+
+from .instrument import phase
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def day_dir(day: int) -> Path:
+    return REPO_ROOT / f"{day:02d}"
+
+
+def available_days() -> list[int]:
+    return sorted(int(path.parent.name) for path in REPO_ROOT.glob('[0-9][0-9]/main.py'))
+
+
+def load_day(day: int, module: str = 'main'):
+    """Import NN/<module>.py without running its script entry point.
+
+    The day directory goes on sys.path so the day's helper modules resolve
+    the same way they do when the script is run directly.
+    """
+    name = f"aoc25_day{day:02d}_{module}"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = day_dir(day) / f"{module}.py"
+    if not path.exists():
+        raise FileNotFoundError(f"No module {module!r} for day {day:02d} ({path})")
+
+    directory = str(path.parent)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    day_module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = day_module
+    spec.loader.exec_module(day_module)
+    return day_module
+
+
+def read_input(day: int, input_path: str | None = None, example: bool = False) -> str:
+    """Read an explicit input file, '-' for stdin, or the day's input/example file."""
+    if input_path == '-':
+        return sys.stdin.read()
+    if input_path is None:
+        input_path = day_dir(day) / ('example.txt' if example else 'input.txt')
+    with open(input_path, 'r') as input_file:
+        return input_file.read()
+
+
+def run_day(day: int, text: str, module: str = 'main') -> dict:
+    """Parse and solve one day, timing each phase.
+
+    Day functions report progress through aoc25.log, so how much of it
+    shows up is down to the level the caller configured. Each step is also
+    an instrument phase ("day NN parse", "day NN part 1", ...), since day
+    scripts only mark theirs in main(), which the runner never calls.
+    """
+    day_module = load_day(day, module)
+    timings = {}
+
+    start = time.perf_counter()
+    with phase(f"day {day:02d} parse"):
+        data = day_module.parse(text)
+    timings['parse'] = time.perf_counter() - start
+
+    answers = []
+    for part in ('part1', 'part2'):
+        start = time.perf_counter()
+        with phase(f"day {day:02d} part {part[-1]}"):
+            answers.append(getattr(day_module, part)(data))
+        timings[part] = time.perf_counter() - start
+
+    return {'day': day, 'module': module, 'part1': answers[0], 'part2': answers[1], 'timings': timings}